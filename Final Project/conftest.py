@@ -0,0 +1 @@
+# pytest puts this folder on sys.path so the tests can import the vgc package
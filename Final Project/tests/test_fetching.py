@@ -0,0 +1,25 @@
+import asyncio
+import requests
+from vgc.fetching import Fetch_Engine
+
+#Answers every url with its own address instead of going to the network
+class Offline_Engine(Fetch_Engine):
+    def request(self, url, headers):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = url.encode()
+        return response
+
+def test_get_many():
+    responses = Offline_Engine().get_many(['http://a/1', 'http://a/2', 'http://a/1'])
+    assert {url: response.content for url, response in responses.items()} == {'http://a/1': b'http://a/1', 'http://a/2': b'http://a/2'}
+
+def test_get_many_inside_running_loop():
+    engine = Offline_Engine()
+
+    async def caller():
+        return engine.get_many(['http://a/1']), await engine.get_many_async(['http://b/2'])
+
+    responses, awaited = asyncio.run(caller())
+    assert responses['http://a/1'].content == b'http://a/1'
+    assert awaited['http://b/2'].content == b'http://b/2'
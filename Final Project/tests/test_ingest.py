@@ -0,0 +1,37 @@
+import json
+import pickle
+import pandas as pd
+from vgc import ingest
+
+members = ['incineroar', 'rillaboom', 'flutter-mane', 'urshifu', 'amoonguss', 'tornadus']
+
+#Results of a tournament with no pastes, so every team is hashed from its members instead of fetched
+def write_results(folder, ranks):
+    pd.DataFrame([[rank, 100 - rank, None] + members for rank in ranks],
+                 columns = ['Rank', 'CP', 'Pokepaste'] + [f"Pokemon {i}" for i in range(1, 7)]).to_csv(folder / 'T.csv', index = False)
+
+#Stands in for parse_pokepastes, a parsed team only records its placement
+def parse(results, tournament, rows = None):
+    return {f"{tournament} Team {team+1}": {'placement': int(results.iloc[team, 0])} for team in rows}
+
+def test_ingest_tournaments(monkeypatch, tmp_path):
+    monkeypatch.setattr(ingest, 'regional_data', str(tmp_path))
+    monkeypatch.setattr(ingest, 'parse_pokepastes', parse)
+    monkeypatch.setattr(ingest.fetch_engine, 'get_many', lambda urls: {})
+    manifest_path = str(tmp_path / 'manifest.json')
+
+    # A pickle from before the manifest existed, the seeded manifest is saved even though nothing changed
+    write_results(tmp_path, [1, 2, 3])
+    with open(tmp_path / 'T.pkl', 'wb') as file:
+        pickle.dump({f"T Team {team}": {'placement': team} for team in [1, 2, 3]}, file)
+    ingest.ingest_tournaments(['T'], manifest_path)
+    with open(manifest_path) as file:
+        assert sorted(json.load(file)['T']) == ['1', '2', '3']
+
+    # A placement taken out of the csv is dropped from the pickle and the manifest
+    write_results(tmp_path, [1, 2])
+    ingest.ingest_tournaments(['T'], manifest_path)
+    with open(tmp_path / 'T.pkl', 'rb') as file:
+        assert sorted(pickle.load(file)) == ['T Team 1', 'T Team 2']
+    with open(manifest_path) as file:
+        assert sorted(json.load(file)['T']) == ['1', '2']
@@ -0,0 +1,14 @@
+from vgc.move_dex import move_dex
+from vgc.pokedex import Pokedex
+
+def test_move_pools_follow_the_learnsets(monkeypatch):
+    monkeypatch.setattr(move_dex, 'move_database', {'tackle': {'name': 'tackle', 'damage_type': 'physical'},
+                                                    'swift': {'name': 'swift', 'damage_type': 'special'},
+                                                    'growl': {'name': 'growl', 'damage_type': 'status'}})
+    dex = Pokedex()
+    dex.load_learnsets({'a': {'tackle'}})
+    assert [[move['name'] for move in pool] for pool in dex.move_pools('a')] == [[], ['tackle'], []]
+
+    # A learnset table of the same size replaced or edited in place still rebuilds the matrix
+    dex.load_learnsets({'a': {'growl', 'swift'}})
+    assert [[move['name'] for move in pool] for pool in dex.move_pools('a')] == [['growl'], [], ['swift']]
@@ -0,0 +1,40 @@
+import json
+import os
+import requests
+from vgc import scraping
+from vgc.move_dex import Move_Dex
+
+#Stands in for fetch_engine.get, every url gets the same status
+def answer(monkeypatch, status):
+    def get(url):
+        response = requests.Response()
+        response.status_code = status
+        response.url = url
+        return response
+    monkeypatch.setattr(scraping.fetch_engine, 'get', get)
+
+def test_failed_request_is_not_saved(monkeypatch, tmp_path):
+    dex = Move_Dex()
+    dex.load_missing(str(tmp_path / 'missing_moves.json'))
+    answer(monkeypatch, 503)
+    assert dex.get_move_info('made-up-move') is None
+    assert 'made-up-move' in dex.failed_moves
+    assert 'made-up-move' not in dex.missing_moves
+    assert not (tmp_path / 'missing_moves.json').exists()
+
+def test_move_pokeapi_doesnt_have_is_saved(monkeypatch, tmp_path):
+    dex = Move_Dex()
+    dex.load_missing(str(tmp_path / 'missing_moves.json'))
+    answer(monkeypatch, 404)
+    assert dex.get_move_info('made-up-move') is None
+    with open(tmp_path / 'missing_moves.json') as file:
+        assert json.load(file) == ['made-up-move']
+
+def test_no_new_missing_moves_doesnt_rewrite_the_file(tmp_path):
+    dex = Move_Dex()
+    dex.load_missing(str(tmp_path / 'missing_moves.json'))
+    dex.add_missing(['made-up-move'], saved = True)
+    written = os.path.getmtime(tmp_path / 'missing_moves.json')
+    os.utime(tmp_path / 'missing_moves.json', (written - 100, written - 100))
+    dex.add_missing([], saved = True)
+    assert os.path.getmtime(tmp_path / 'missing_moves.json') == written - 100
@@ -0,0 +1,77 @@
+import itertools
+import os
+import pickle
+import numpy as np
+import pytest
+from vgc.move_dex import move_dex
+from vgc.move_table import move_table, strong_types
+from vgc.paths import class_data
+
+#rate_move as it was before the rating table, one move at a time
+def scalar_rate_move(move_info, poke_info):
+    rate = 1
+    try:
+        if move_info['damage_type'] != 'status':
+            if move_info['type'] in poke_info['types']:
+                rate *= 1.1
+            if move_info['type'] in strong_types:
+                rate *= 1.5
+        if move_info['accuracy'] != None:
+            if float(move_info['accuracy']) > 0:
+                rate *= float(move_info['accuracy'])/100
+        if move_info['power'] != None:
+            if float(move_info['power']) > 0:
+                rate *= (1+float(move_info['power'])/100)
+        if float(move_info['priority']) != 0:
+            if float(move_info['priority']) > 0:
+                rate *= (1+float(move_info['priority'])/10)
+            if float(move_info['priority']) < 0:
+                rate *= (1-float(move_info['priority'])/10)
+        if move_info['target'] != 'selected-pokemon':
+            rate *= 1.5
+        if move_info['ailment_name'] != 'none':
+            rate *= (1+float(move_info['ailment_chance'])/100)
+        if move_info['crit_rate'] != 0:
+            rate *= (1+float(move_info['crit_rate']))
+        if move_info['drain'] != 0:
+            rate *= (1+float(move_info['drain'])/100)
+        if move_info['flinch_chance'] != 0:
+            rate *= (1+float(move_info['flinch_chance'])/100)
+        if move_info['healing'] != 0:
+            rate *= (1+float(move_info['healing'])/100)
+        if move_info['max_hits'] != None:
+            if float(move_info['max_hits']) > 0:
+                rate *= float(move_info['max_hits'])*(float(move_info['accuracy'])/100)**(float(move_info['max_hits'])-1)
+        if len(move_info['stat_changes']) != 0:
+            for stat in move_info['stat_changes']:
+                if float(stat['change']) < 0:
+                    rate *= abs(0.9*float(stat['change']))
+                else:
+                    rate *= 1.1*float(stat['change'])
+        if 'attacker' in poke_info['roles'] and move_info['damage_type'] == 'physical':
+            rate *= 1.5
+        if 'sp_attacker' in poke_info['roles'] and move_info['damage_type'] == 'special':
+            rate *= 1.5
+        if 'bulky' in poke_info['roles'] and move_info['damage_type'] == 'status':
+            rate *= 1.5
+        return rate
+    except:
+        return 1
+
+@pytest.fixture
+def saved_moves(monkeypatch):
+    with open(os.path.join(class_data, 'move_dex.pkl'), 'rb') as file:
+        monkeypatch.setattr(move_dex, 'move_database', pickle.load(file))
+    return move_dex.move_database
+
+def test_rate_move_matches_the_scalar_formula(saved_moves):
+    roles = ['attacker', 'sp_attacker', 'bulky']
+    role_sets = [list(chosen) for size in range(4) for chosen in itertools.combinations(roles, size)]
+    # Every 7th move covers status, physical, special, multi hit, priority and stat change moves
+    for move_name in list(saved_moves)[::7]:
+        move_info = saved_moves[move_name]
+        for member_roles in role_sets:
+            for types in [[move_info.get('type')], ['stellar']]:
+                poke_info = {'types': types, 'roles': member_roles}
+                assert np.isclose(move_dex.rate_move(move_name, poke_info), scalar_rate_move(move_info, poke_info)), (move_name, poke_info)
+    assert move_table.size == len(saved_moves)
@@ -0,0 +1,50 @@
+import pandas as pd
+import requests
+from vgc import pastes
+
+paste = """Fluffy (Ninetales-Alola) (F) @ Light Clay
+Ability: Snow Warning
+Tera Type: Ghost
+EVs: 252 HP / 4 Def / 252 Spe
+Timid Nature
+- Aurora Veil
+- Blizzard
+
+Tauros-Paldea-Aqua @ Mystic Water
+Ability: Intimidate
+- Wave Crash
+
+Indeedee-F @ Psychic Seed
+Ability: Psychic Surge
+- Follow Me
+
+Iron Hands @ Assault Vest
+Ability: Quark Drive
+- Fake Out
+
+Ursaluna-Bloodmoon @ Life Orb
+Ability: Mind's Eye
+- Blood Moon
+
+Urshifu-Rapid-Strike @ Choice Scarf
+Ability: Unseen Fist
+- Surging Strikes
+"""
+
+listed = ['ursaluna-bloodmoon', 'iron-hands', 'ninetales-alola', 'indeedee-female', 'urshifu-rapid-strike', 'tauros-paldea-aqua-breed']
+results = pd.DataFrame([[1, 350, 'https://pokepast.es/abc', *listed]])
+
+def test_regional_and_form_names_match_read_pokepaste(monkeypatch):
+    def get_many(urls):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = paste.encode()
+        return {url: response for url in urls}
+    monkeypatch.setattr(pastes.fetch_engine, 'get_many', get_many)
+
+    members = pastes.parse_tournament_exports(results, 'Test')
+    team = pastes.read_pokepaste(results.iloc[0], paste)
+
+    expected = ['ninetales-alola', 'tauros-paldea-aqua-breed', 'indeedee-female', 'iron-hands', 'ursaluna-bloodmoon', 'urshifu-rapid-strike']
+    assert list(members['name']) == expected
+    assert [team[f"Member {i+1}"]['name'] for i in range(6)] == expected
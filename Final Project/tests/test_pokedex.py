@@ -0,0 +1,38 @@
+import numpy as np
+from vgc.pokedex import Pokedex, pokedex, stat_names, nature_effects, nature_names, batch_final_stats
+
+#Level 50 stats one stat at a time, the formulas calculate_final_stats used before the nature matrix
+def scalar_final_stats(base_stats, evs, ivs, nature):
+    modifiers = nature_effects.get(nature.capitalize(), {})
+    stats = {}
+    for stat, base in base_stats.items():
+        if stat == 'hp':
+            stats[stat] = ((2*base + 31 + evs[stat]//4)*50)//100 + 50 + 10
+        else:
+            stats[stat] = int((((2*base + ivs[stat] + evs[stat]//4)*50)//100 + 5)*modifiers.get(stat, 1.0))
+    return stats
+
+def test_final_stats_match_the_scalar_formula():
+    rng = np.random.default_rng(5)
+    # Every nature, neutral ones included, and a nature the table doesn't have
+    for nature in [name.lower() for name in nature_names] + ['unknown']:
+        for _ in range(20):
+            base_stats = dict(zip(stat_names, rng.integers(1, 256, size = 6).tolist()))
+            evs = dict(zip(stat_names, rng.integers(0, 253, size = 6).tolist()))
+            ivs = dict(zip(stat_names, rng.integers(0, 32, size = 6).tolist()))
+            expected = scalar_final_stats(base_stats, evs, ivs, nature)
+            assert pokedex.calculate_final_stats(base_stats, evs, ivs, nature) == expected
+
+            # The batched path gives the same stats, with HP ignoring its iv and nature
+            batch = batch_final_stats([base_stats[stat] for stat in stat_names], [evs[stat] for stat in stat_names],
+                                      [ivs[stat] for stat in stat_names], nature_names.index(nature.capitalize()) if nature != 'unknown' else 0)
+            assert dict(zip(stat_names, batch.tolist())) == expected
+
+def test_load_database_moves_scraped_names_to_ids():
+    dex = Pokedex()
+    dex.load_database({'rotom [wash rotom]': {'name': 'rotom [wash rotom]', 'bst': 1}, 'rotom-wash': {'name': 'rotom-wash', 'bst': 2}})
+    assert dex.pokemon_database == {'rotom-wash': {'name': 'rotom-wash', 'bst': 2}}
+
+    # With only the old key the entry is moved under the id
+    dex.load_database({'ninetales [alolan form]': {'name': 'ninetales [alolan form]'}})
+    assert dex.pokemon_database == {'ninetales-alola': {'name': 'ninetales-alola'}}
@@ -0,0 +1,25 @@
+from vgc.pokedex import pokedex
+from vgc.sampling import Set_Sampler
+
+#Pikalytics shaped usage for a made up species
+def species_data(name):
+    return {'name': name,
+            'items': [['leftovers', 60.0], ['sitrus-berry', 40.0]],
+            'abilities': [['pressure', 100.0]],
+            'moves': [[move, 50.0] for move in ['protect', 'tackle', 'growl', 'rest', 'other']],
+            'natures/evs': [{'nature': 'bold', 'hp': 252, 'attack': 0, 'defense': 252, 'sp_attack': 0, 'sp_defense': 4, 'speed': 0, 'usage': 70.0},
+                            {'nature': 'calm', 'hp': 252, 'attack': 0, 'defense': 4, 'sp_attack': 0, 'sp_defense': 252, 'speed': 0, 'usage': 30.0}]}
+
+def test_sample_many_streams_follow_the_species(monkeypatch):
+    monkeypatch.setattr(pokedex, 'pokemon_database', {name: species_data(name) for name in ['a', 'b']})
+    monkeypatch.setattr(pokedex, 'learnsets', {name: {'protect', 'tackle', 'growl', 'rest', 'swift', 'bite'} for name in ['a', 'b']})
+    sampler = Set_Sampler()
+
+    together = sampler.sample_many(['a', 'b'], 20, 7)
+    alone = sampler.sample_many(['b'], 20, 7)
+    assert together[1] == alone[0]
+    assert sampler.sample_many(['b', 'a'], 20, 7) == together[::-1]
+
+    # The same species twice in one call still gets two different streams
+    twice = sampler.sample_many(['a', 'a'], 20, 7)
+    assert twice[0] == together[0] and twice[1] != twice[0]
@@ -0,0 +1,23 @@
+import pytest
+from vgc.move_dex import move_dex
+from vgc.pokedex import pokedex
+from vgc.spreads import optimize_spread, make_hit
+
+def test_leftover_evs_stay_under_max_speed(monkeypatch):
+    base_stats = {'hp': 100, 'attack': 100, 'defense': 100, 'sp_attack': 100, 'sp_defense': 100, 'speed': 100}
+    monkeypatch.setattr(pokedex, 'pokemon_database', {'a': {'name': 'a', 'base_stats': base_stats}})
+
+    spread = optimize_spread('a', speed = 110, max_speed = 120, invest = ('speed', 'hp', 'defense'))
+    assert 110 <= spread['stats']['speed'] <= 120
+    assert spread['evs']['hp'] == 252 and spread['evs']['defense'] == 252
+
+    # Without a ceiling speed still takes everything it can
+    assert optimize_spread('a', invest = ('speed', 'hp'))['evs']['speed'] == 252
+
+def test_make_hit_needs_a_damaging_move(monkeypatch):
+    monkeypatch.setattr(move_dex, 'move_database', {'protect': {'name': 'protect', 'power': None, 'type': 'normal', 'damage_type': 'status'},
+                                                    'counter': {'name': 'counter', 'power': None, 'type': 'fighting', 'damage_type': 'physical'}})
+    monkeypatch.setattr(move_dex, 'missing_moves', {'made-up-move'})
+    for move_name in ['protect', 'counter', 'made-up-move']:
+        with pytest.raises(ValueError, match = move_name):
+            make_hit('a', move_name, 'b')
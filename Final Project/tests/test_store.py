@@ -0,0 +1,38 @@
+import os
+import pickle
+from vgc.store import Team_Store, update_team_store
+
+member = {'name': 'incineroar', 'item': 'safety-goggles', 'ability': 'intimidate', 'tera_type': 'ghost', 'evs': None,
+          'nature': None, 'ivs': None, 'moves': ['fake-out']}
+
+#Saves a tournament pickle with one team and sets its mtime
+def write_tournament(folder, name, placement, mtime):
+    path = os.path.join(folder, f"{name}.pkl")
+    with open(path, 'wb') as file:
+        pickle.dump({f"{name} Team 1": {'Member 1': member, 'placement': placement, 'cp': 0.0}}, file)
+    os.utime(path, (mtime, mtime))
+
+def test_update_team_store(tmp_path):
+    store = str(tmp_path / 'store')
+    write_tournament(tmp_path, 'A', 1, 1000)
+    assert update_team_store(['A'], store, tmp_path)
+    assert not update_team_store(['A'], store, tmp_path)
+
+    # A tournament the store doesn't have yet is added without losing the others
+    write_tournament(tmp_path, 'B', 2, 1000)
+    assert update_team_store(['B'], store, tmp_path)
+    assert sorted(Team_Store(store).slices) == ['A', 'B']
+
+    # A pickle written after the store was built replaces the store's copy
+    write_tournament(tmp_path, 'A', 5, 2000)
+    assert update_team_store(['A', 'B'], store, tmp_path)
+    assert Team_Store(store).tournament('A')['A Team 1']['placement'] == 5
+
+def test_select_unknown_species(tmp_path):
+    store = str(tmp_path / 'store')
+    write_tournament(tmp_path, 'A', 1, 1000)
+    update_team_store(['A'], store, tmp_path)
+    team_store = Team_Store(store)
+    assert len(team_store.select(species = 'incineroar')['A']) == 1
+    assert len(team_store.select(species = 'missingno')['A']) == 0
+    assert team_store.code('species', 'missingno') == -1
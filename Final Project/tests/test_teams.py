@@ -0,0 +1,68 @@
+import numpy as np
+from vgc.move_dex import move_dex
+from vgc.move_table import flag_bits
+from vgc.teams import Teams, flag_count, synergy_kernels, move_coverage_kernels
+from vgc.type_chart import type_chart
+
+#A team made straight from member dicts, without loading the data or the pokedex
+def make_team(members):
+    team = Teams.__new__(Teams)
+    team.team = {f"Member {index + 1}": member for index, member in enumerate(members)}
+    team.member_names = [member['name'] for member in members]
+    team.slot_flags = None
+    return team
+
+def member(name, types, moves):
+    return {'name': name, 'types': types, 'moves': moves, 'item': None}
+
+def test_distinct_moves_keeps_moves_the_table_doesnt_have(monkeypatch):
+    monkeypatch.setattr(move_dex, 'move_database', {'tackle': {'name': 'tackle', 'type': 'normal', 'damage_type': 'physical'}})
+    team = make_team([member('Torkoal', ['fire'], ['sunny-day', 'solar-beam', 'tackle']),
+                      member('Venusaur', ['grass', 'poison'], ['growth', 'solar-beam', 'tackle'])] +
+                     [member('Ditto', ['normal'], []) for _ in range(4)])
+
+    flags, types = team.distinct_moves()
+    assert len(flags) == 4
+    assert flag_count(flags, 'sun_boosted') == 2
+    assert flag_count(flags, 'sets_sun') == 1
+
+    # Torkoal abusing its own sun, then Solar Beam and Growth
+    assert team.weather() == 3
+    assert flags[0] & flag_bits['sets_sun']
+
+#A team of the given typings with the defensive and STAB bits load_instance gives its members
+def typed_team(typings):
+    members = []
+    for index, typing in enumerate(typings):
+        members.append({'name': f"member-{index}", 'types': typing, 'item': None, 'moves': [],
+                        'defensive_bits': type_chart.shared_def_bits(typing), 'stab_bits': type_chart.shared_stab_bits(typing)})
+    return make_team(members)
+
+#move_coverage and move_resisted of one team, one defending type at a time
+def scalar_coverage(move_types):
+    hit = 0
+    resisted = 0
+    for defense_type in type_chart.types:
+        effective = [type_chart.effectiveness_internal(attack_type, defense_type) for attack_type in move_types]
+        strong = sum(value == 2.0 for value in effective)
+        hit += strong > 0
+        resisted += sum(value < 1.0 for value in effective) > strong
+    return hit, resisted
+
+def test_kernels_match_the_per_team_methods():
+    rng = np.random.default_rng(3)
+    teams = []
+    typing_rows = []
+    move_rows = []
+    for _ in range(40):
+        typings = [[type_chart.types[i] for i in rng.choice(18, size = rng.integers(1, 3), replace = False)] for _ in range(6)]
+        move_types = rng.integers(-1, 18, size = 24)
+        teams.append((typed_team(typings), move_types))
+        typing_rows.append([type_chart.typing_id(typing) for typing in typings])
+        move_rows.append(move_types)
+
+    synergy = synergy_kernels(typing_rows)
+    coverage = move_coverage_kernels(move_rows)
+    for i, (team, move_types) in enumerate(teams):
+        assert np.allclose(synergy[i], [team.core_synergy(), team.def_synergy(), team.off_synergy()])
+        assert tuple(coverage[i]) == scalar_coverage([type_chart.types[move] for move in move_types if move >= 0])
@@ -0,0 +1,52 @@
+import itertools
+import pytest
+from vgc.type_chart import type_chart
+
+#def_coverage as it was before the dual typing tensor, one attacking type at a time
+def scalar_def_coverage(typing):
+    coverage = {'Immune': [], 'Resistant': [], 'Super Resistant': [], 'Weak': [], 'Super Weak': []}
+    categories = {0: 'Immune', 0.5: 'Resistant', 0.25: 'Super Resistant', 2.0: 'Weak', 4.0: 'Super Weak'}
+    for attack_type in type_chart.types:
+        value = 1
+        for defense_type in typing:
+            value *= type_chart.effectiveness_internal(attack_type, defense_type)
+        if value in categories:
+            coverage[categories[value]].append(attack_type)
+    return coverage
+
+#get_stab_coverage as it was before the mask tables
+def scalar_stab_coverage(typing):
+    coverage = {'Immune': [], 'Resistant': [], 'Strong': []}
+    for defense_type in type_chart.types:
+        effects = [type_chart.effectiveness_internal(attack_type, defense_type) for attack_type in typing]
+        if all(effect == 0 for effect in effects):
+            coverage['Immune'].append(defense_type)
+        if all(effect <= 0.5 for effect in effects) and 0.5 in effects:
+            coverage['Resistant'].append(defense_type)
+        if 2.0 in effects:
+            coverage['Strong'].append(defense_type)
+    return coverage
+
+def type_mask(types):
+    return sum(type_chart.type_bits[attack_type] for attack_type in types)
+
+typings = [[attack_type] for attack_type in type_chart.types] + [list(pair) for pair in itertools.combinations(type_chart.types, 2)]
+
+@pytest.mark.parametrize('typing', typings, ids = '/'.join)
+def test_coverage_tables_match_the_dict_results(typing):
+    defense = scalar_def_coverage(typing)
+    stab = scalar_stab_coverage(typing)
+    assert type_chart.def_coverage(typing) == defense
+    assert type_chart.get_stab_coverage(typing) == stab
+    assert dict(type_chart.shared_def_coverage(typing)) == {category: tuple(types) for category, types in defense.items()}
+    assert dict(type_chart.shared_def_bits(typing)) == {category: type_mask(types) for category, types in defense.items()}
+    assert dict(type_chart.shared_stab_bits(typing)) == {category: type_mask(types) for category, types in stab.items()}
+
+    # The reversed dual typing is the same typing
+    assert type_chart.def_coverage(typing[::-1]) == defense
+
+    # The shared tables are read only, the fresh dicts aren't
+    with pytest.raises(TypeError):
+        type_chart.shared_def_coverage(typing)['Weak'] = ()
+    type_chart.def_coverage(typing)['Weak'].append('normal')
+    assert type_chart.def_coverage(typing) == defense
@@ -0,0 +1,34 @@
+import importlib
+
+#Names exported by the package and the module each lives in, a module is only imported the first time one of its names is used
+exports = {
+    'Type_Chart': 'type_chart',
+    'Species_Aliases': 'aliases',
+    'Pokedex': 'pokedex',
+    'Move_Dex': 'move_dex',
+    'Move_Table': 'move_table',
+    'Teams': 'teams',
+    'tree_data': 'teams',
+    'score_paste': 'teams',
+    'load_data': 'data',
+    'read_showdown_team': 'showdown',
+    'parse_showdown_exports': 'showdown',
+    'Fetch_Engine': 'fetching',
+    'Response_Cache': 'fetching',
+    'ingest_tournaments': 'ingest',
+    'impute_teams': 'pastes',
+    'set_sampler': 'sampling',
+    'optimize_spread': 'spreads',
+    'Team_Store': 'store',
+    'build_team_store': 'store',
+    'update_team_store': 'store',
+    'random_forest_classifer': 'model'
+}
+
+def __getattr__(name):
+    if name in exports:
+        return getattr(importlib.import_module(f".{exports[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(exports))
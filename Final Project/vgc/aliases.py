@@ -0,0 +1,127 @@
+#Whole names that always map to one pokemon, whatever form is in brackets
+species_bases = {
+    'Basculegion': 'basculegion-male',
+    'Maushold': 'maushold-family-of-four',
+    'Sinistcha': 'sinistcha'
+}
+
+#Bracketed forms that name the pokemon on their own
+species_tags = {
+    'Bloodmoon': 'ursaluna-bloodmoon',
+    'Paldean Form - Aqua Breed': 'tauros-paldea-aqua-breed'
+}
+
+#Forms that only matter for one pokemon
+species_forms = {
+    ('Indeedee', 'Female'): 'indeedee-female',
+    ('Indeedee', 'Male'): 'indeedee-male',
+    ('Tatsugiri', 'Curly Form'): 'tatsugiri-curly',
+    ('Rotom', 'Wash Rotom'): 'rotom-wash'
+}
+
+#Regional forms become a suffix of the name
+form_suffixes = {
+    'Hisuian Form': '-hisui',
+    'Alolan Form': '-alola',
+    'Galarian Form': '-galar'
+}
+
+#Url slugs that differ from our ids, by source
+source_slugs = {
+    'pikalytics': {
+        'maushold-family-of-four': 'maushold',
+        'tauros-paldea-aqua-breed': 'tauros-paldea-aqua',
+        'tatsugiri-curly': 'tatsugiri'
+    },
+    'pokeapi': {}
+}
+
+#Showdown species names that differ from our ids
+showdown_ids = {
+    'basculegion': 'basculegion-male',
+    'basculegion-f': 'basculegion-male',
+    'indeedee': 'indeedee-male',
+    'indeedee-f': 'indeedee-female',
+    'maushold': 'maushold-family-of-four',
+    'maushold-four': 'maushold-family-of-four',
+    'tatsugiri': 'tatsugiri-curly',
+    'tauros-paldea-aqua': 'tauros-paldea-aqua-breed'
+}
+
+#Scraped names -> our ids, and our ids -> the slug each site uses, every name is only worked out once
+class Species_Aliases:
+    def __init__(self):
+        self.aliases = {}
+        self.slugs = {source: {} for source in source_slugs}
+
+    def resolve(self, alt):
+        """Work out the id for a scraped name like 'Ninetales [Alolan Form]'"""
+        base, _, tag = alt.partition(' [')
+        tag = tag.rstrip(']')
+        if base in species_bases:
+            return species_bases[base]
+        if tag in species_tags:
+            return species_tags[tag]
+        if (base, tag) in species_forms:
+            return species_forms[(base, tag)]
+        if tag in form_suffixes:
+            return f"{base}{form_suffixes[tag]}".lower()
+        return alt.lower()
+
+    def canonical(self, alt):
+        try:
+            return self.aliases[alt]
+        except KeyError:
+            self.aliases[alt] = self.resolve(alt)
+            return self.aliases[alt]
+
+    def canonical_series(self, series):
+        """Canonical ids for a whole column, each distinct name is resolved once then mapped"""
+        for alt in series.dropna().unique():
+            self.canonical(alt)
+        return series.map(self.aliases)
+
+    def canonical_columns(self, df, columns):
+        df = df.copy()
+        for column in columns:
+            df[column] = self.canonical_series(df[column])
+        return df
+
+    def migrate(self, database):
+        """Moves entries saved under a lowercased scraped name like 'rotom [wash rotom]' to their id, an entry already under the id wins"""
+        for key in [key for key in database if ' [' in key]:
+            pokemon_id = self.canonical(key.title())
+            if pokemon_id == key:
+                continue
+            entry = database.pop(key)
+            if pokemon_id not in database:
+                if isinstance(entry, dict) and 'name' in entry:
+                    entry['name'] = pokemon_id
+                database[pokemon_id] = entry
+        return database
+
+    def showdown(self, species):
+        """Id for the species in a Showdown export header like 'indeedee-f'"""
+        return showdown_ids.get(species, species)
+
+    def resolve_slug(self, pokemon_name, source):
+        name = pokemon_name.lower()
+        if name in source_slugs[source]:
+            return source_slugs[source][name]
+        if source == 'pikalytics':
+            if '-male' in name:
+                name = name.replace('-male', '')
+            if '-female' in name:
+                name = name.replace('-female', '-f')
+        return name
+
+    def slug(self, pokemon_name, source):
+        """Name of the pokemon in the urls of 'pikalytics' or 'pokeapi'"""
+        slugs = self.slugs[source]
+        try:
+            return slugs[pokemon_name]
+        except KeyError:
+            slugs[pokemon_name] = self.resolve_slug(pokemon_name, source)
+            return slugs[pokemon_name]
+
+species_aliases = Species_Aliases()
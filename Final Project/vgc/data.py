@@ -0,0 +1,53 @@
+import csv
+import os
+import pickle
+from .paths import class_data, usage_csv, missing_moves
+from .pokedex import pokedex
+from .move_dex import move_dex
+from .move_table import move_table, load_move_table
+
+learnsets_path = os.path.join(class_data, 'learnsets.pkl')
+move_table_path = os.path.join(class_data, 'move_table.npz')
+
+#Filled in by load_data, nothing is read on import
+usage = None
+all_items = None
+
+#Loads the usage table and the saved moves, pokemon, items and learnsets, only the first call reads anything
+def load_data():
+    global usage, all_items
+    if usage is not None:
+        return
+
+    # load information about the moves, pokemon, and items to avoid scrapping everytime
+    with open(os.path.join(class_data, 'move_dex.pkl'), 'rb') as file:
+        move_dex.load_moves(pickle.load(file))
+    load_move_table(move_table_path)
+    move_dex.load_missing(missing_moves)
+
+    with open(os.path.join(class_data, 'pokedex.pkl'), 'rb') as file:
+        pokedex.load_database(pickle.load(file))
+
+    with open(os.path.join(class_data, 'items.pkl'), 'rb') as file:
+        all_items = pickle.load(file)
+
+    if os.path.exists(learnsets_path):
+        with open(learnsets_path, 'rb') as file:
+            pokedex.load_learnsets(pickle.load(file))
+
+    # time weighted usage from smoogon, read as {pokemon: {month: usage}} so scoring doesn't need pandas
+    with open(usage_csv, newline = '') as file:
+        usage = {row.pop('Pokemon'): {column: float(value) for column, value in row.items() if column}
+                 for row in csv.DictReader(file)}
+
+#Learnsets are built once from PokeAPI and saved so making teams doesn't need the network
+def save_learnsets():
+    from .scraping import build_learnsets
+    pokedex.load_learnsets(build_learnsets(pokedex.pokemon_database))
+    with open(learnsets_path, 'wb') as file:
+        pickle.dump(pokedex.learnsets, file)
+
+#The saved move table is only written here, after move_dex.pkl changes, so loading never rewrites it
+def save_move_table():
+    load_data()
+    move_table.sync().save(move_table_path)
@@ -0,0 +1,259 @@
+import requests
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .paths import http_cache
+
+#Token bucket so each host gets a steady request rate instead of a fixed sleep
+class Token_Bucket:
+    def __init__(self, rate, capacity = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return how many seconds to wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last)*self.rate)
+            self.last = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens/self.rate
+
+#Raised when the cache is offline and has never seen the url
+class Cache_Miss(requests.RequestException):
+    pass
+
+#Content addressed store of responses so reruns and reparsing don't need the network
+class Response_Cache:
+    def __init__(self, path, ttl = 7*24*60*60, offline = False):
+        self.path = path
+        self.ttl = ttl
+        self.offline = offline
+
+    def url_path(self, url):
+        return os.path.join(self.path, 'urls', hashlib.sha256(url.encode()).hexdigest() + '.json')
+
+    def body_path(self, digest):
+        return os.path.join(self.path, 'bodies', digest)
+
+    def write(self, path, data):
+        """Write through a temporary file so a crash never leaves half a file behind"""
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        temp = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp, 'wb') as file:
+            file.write(data)
+        os.replace(temp, path)
+
+    def lookup(self, url):
+        """Metadata stored for the url, None if it was never cached"""
+        try:
+            with open(self.url_path(url), 'r') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def read(self, url):
+        """Raw body stored for the url, lets old pages be parsed again"""
+        meta = self.lookup(url)
+        if meta is None:
+            return None
+        with open(self.body_path(meta['hash']), 'rb') as file:
+            return file.read()
+
+    def fresh(self, meta):
+        return self.ttl is None or time.time() - meta['fetched'] < self.ttl
+
+    def revalidation_headers(self, meta):
+        headers = {}
+        if meta is not None:
+            if meta['etag'] is not None:
+                headers['If-None-Match'] = meta['etag']
+            if meta['last_modified'] is not None:
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url, response):
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        if not os.path.exists(self.body_path(digest)):
+            self.write(self.body_path(digest), body)
+
+        meta = {
+            'url': url,
+            'hash': digest,
+            'status': response.status_code,
+            'encoding': response.encoding,
+            'content_type': response.headers.get('Content-Type'),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched': time.time()
+        }
+        self.write(self.url_path(url), json.dumps(meta).encode())
+        return meta
+
+    def refresh(self, url, meta):
+        """Server answered 304, the stored body is still good"""
+        meta['fetched'] = time.time()
+        self.write(self.url_path(url), json.dumps(meta).encode())
+
+    def response(self, url, meta):
+        """Rebuild a requests.Response from the stored body"""
+        response = requests.Response()
+        response.url = url
+        response.status_code = meta['status']
+        response.encoding = meta['encoding']
+        if meta['content_type'] is not None:
+            response.headers['Content-Type'] = meta['content_type']
+        with open(self.body_path(meta['hash']), 'rb') as file:
+            response._content = file.read()
+        return response
+
+#Fetches pages one at a time or many at once while rate limiting each host
+class Fetch_Engine:
+    def __init__(self, host_rates = None, default_rate = 2, max_workers = 16, cache = None, timeout = (5, 30), retries = 3):
+        self.host_rates = host_rates or {}
+        self.default_rate = default_rate
+        self.max_workers = max_workers
+        self.cache = cache
+        self.timeout = timeout
+        # Transient errors are retried with exponential backoff (0.5s, 1s, 2s...), honouring Retry-After
+        self.retries = Retry(
+            total = retries,
+            backoff_factor = 0.5,
+            status_forcelist = [429, 500, 502, 503, 504],
+            allowed_methods = ['GET'],
+            respect_retry_after_header = True,
+            raise_on_status = False
+        )
+        self.buckets = {}
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def get_bucket(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.buckets:
+                rate = self.host_rates.get(host, self.default_rate)
+                self.buckets[host] = Token_Bucket(rate, capacity = max(1, int(rate)))
+            return self.buckets[host]
+
+    def get_session(self, url):
+        """Keep-alive session with its own connection pool for each host"""
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections = 1, pool_maxsize = self.max_workers, max_retries = self.retries)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self.sessions[host] = session
+            return self.sessions[host]
+
+    def request(self, url, headers):
+        return self.get_session(url).get(url, headers = headers, timeout = self.timeout)
+
+    def close(self):
+        for session in self.sessions.values():
+            session.close()
+        self.sessions = {}
+
+    def from_cache(self, url):
+        """Cached response if it can be used as is, otherwise the headers to revalidate with"""
+        if self.cache is None:
+            return None, {}
+
+        meta = self.cache.lookup(url)
+        if meta is not None and (self.cache.offline or self.cache.fresh(meta)):
+            return self.cache.response(url, meta), {}
+        if self.cache.offline:
+            raise Cache_Miss(f"{url} is not in the cache")
+        return None, self.cache.revalidation_headers(meta)
+
+    def to_cache(self, url, response):
+        if self.cache is None:
+            return response
+
+        if response.status_code == 304:
+            meta = self.cache.lookup(url)
+            self.cache.refresh(url, meta)
+            return self.cache.response(url, meta)
+        if response.status_code == 200:
+            self.cache.store(url, response)
+        return response
+
+    def get(self, url):
+        response, headers = self.from_cache(url)
+        if response is not None:
+            return response
+
+        time.sleep(self.get_bucket(url).reserve())
+        return self.to_cache(url, self.request(url, headers))
+
+    async def get_async(self, url, semaphore):
+        try:
+            response, headers = self.from_cache(url)
+            if response is not None:
+                return response
+
+            await asyncio.sleep(self.get_bucket(url).reserve())
+            async with semaphore:
+                response = await asyncio.to_thread(self.request, url, headers)
+            return self.to_cache(url, response)
+        except requests.RequestException as e:
+            return e
+
+    async def gather(self, urls):
+        semaphore = asyncio.Semaphore(self.max_workers)
+        responses = await asyncio.gather(*(self.get_async(url, semaphore) for url in urls))
+        return dict(zip(urls, responses))
+
+    def get_many(self, urls):
+        """Fetch every url concurrently, returns {url: response or the RequestException raised}
+        Inside a running event loop (Jupyter, async callers) the batch runs on a worker thread with its own loop,
+        async code can await get_many_async instead"""
+        urls = list(dict.fromkeys(urls))
+        if len(urls) == 0:
+            return {}
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.gather(urls))
+        with ThreadPoolExecutor(max_workers = 1) as executor:
+            return executor.submit(asyncio.run, self.gather(urls)).result()
+
+    async def get_many_async(self, urls):
+        urls = list(dict.fromkeys(urls))
+        if len(urls) == 0:
+            return {}
+        return await self.gather(urls)
+
+    @staticmethod
+    def check(response):
+        """Raise the error stored by get_many or the HTTP error of the response"""
+        if isinstance(response, Exception):
+            raise response
+        response.raise_for_status()
+        return response
+
+#Requests per second allowed for each host
+host_rates = {
+    'pokepast.es': 10,
+    'www.pikalytics.com': 4,
+    'pokeapi.co': 20,
+    'www.nimbasacitypost.com': 2
+}
+
+#Set fetch_engine.cache.offline = True to rerun or reparse everything from the cache only
+fetch_engine = Fetch_Engine(host_rates, cache = Response_Cache(http_cache))
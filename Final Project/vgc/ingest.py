@@ -0,0 +1,139 @@
+import requests
+import hashlib
+import json
+import os
+import pickle
+import pandas as pd
+from .fetching import fetch_engine
+from .pastes import parse_pokepastes
+from .paths import regional_data, ingest_manifest
+
+#Record of tournament -> rank -> paste url and content hash for every team already parsed
+class Ingest_Manifest:
+    def __init__(self, path):
+        self.path = path
+        self.tournaments = {}
+        if os.path.exists(path):
+            with open(path, 'r') as file:
+                self.tournaments = json.load(file)
+
+    def entry(self, tournament, rank):
+        return self.tournaments.get(tournament, {}).get(str(rank))
+
+    def record(self, tournament, rank, team_key, url, digest):
+        self.tournaments.setdefault(tournament, {})[str(rank)] = {'team': team_key, 'url': url, 'hash': digest}
+
+    def seed(self, tournament, results, tournament_teams):
+        """Trust teams parsed before the manifest existed, their hash is filled in on the next revalidation"""
+        for team in range(len(results)):
+            series = results.iloc[team]
+            team_key = f"{tournament} Team {team+1}"
+            if isinstance(tournament_teams.get(team_key), dict):
+                url = None if pd.isna(series.iloc[2]) else series.iloc[2]
+                digest = row_hash(series) if url is None else None
+                self.record(tournament, series.iloc[0], team_key, url, digest)
+
+    def prune(self, tournament, ranks):
+        """Drops the placements that aren't in ranks any more, returns how many were dropped"""
+        entries = self.tournaments.get(tournament, {})
+        removed = [rank for rank in entries if rank not in ranks]
+        for rank in removed:
+            del entries[rank]
+        return len(removed)
+
+    def save(self):
+        temp = f"{self.path}.tmp"
+        with open(temp, 'w') as file:
+            json.dump(self.tournaments, file, indent = 1)
+        os.replace(temp, self.path)
+
+#Content hash of a team without a paste is the hash of its members
+def row_hash(series):
+    return hashlib.sha256('/'.join(str(name) for name in series.iloc[3:9]).encode()).hexdigest()
+
+#Parses only the placements that are new or changed, revalidate also rechecks the pastes already parsed
+#Returns how many teams or manifest entries were parsed or dropped, nothing needs saving when it's 0
+def ingest_tournament(tournament, results, manifest, tournament_teams, revalidate = False):
+    # Placements taken out of the csv are dropped from the teams and the manifest
+    team_keys = {f"{tournament} Team {team+1}" for team in range(len(results))}
+    removed = [team_key for team_key in tournament_teams if team_key not in team_keys]
+    for team_key in removed:
+        del tournament_teams[team_key]
+    pruned = manifest.prune(tournament, {str(rank) for rank in results.iloc[:, 0]})
+
+    candidates = []
+    hashes = {}
+    for team in range(len(results)):
+        series = results.iloc[team]
+        team_key = f"{tournament} Team {team+1}"
+        url = None if pd.isna(series.iloc[2]) else series.iloc[2]
+        entry = manifest.entry(tournament, series.iloc[0])
+
+        if url is None:
+            hashes[team] = row_hash(series)
+        if entry is None or entry['team'] != team_key or entry['url'] != url or team_key not in tournament_teams:
+            candidates.append(team)
+        elif url is None and entry['hash'] != hashes[team]:
+            candidates.append(team)
+        elif url is not None and revalidate:
+            candidates.append(team)
+
+    # Fetched pastes land in the response cache, so parsing them afterwards doesn't refetch
+    urls = [f"{results.iloc[team, 2]}/raw" for team in candidates if team not in hashes]
+    responses = fetch_engine.get_many(urls)
+
+    changed = []
+    for team in candidates:
+        series = results.iloc[team]
+        if team not in hashes:
+            try:
+                text = fetch_engine.check(responses[f"{series.iloc[2]}/raw"]).text
+            except requests.RequestException as e:
+                print(f"Error fetching data: {e}. Team Number:{team+1}")
+                continue
+            hashes[team] = hashlib.sha256(text.encode()).hexdigest()
+
+        entry = manifest.entry(tournament, series.iloc[0])
+        team_key = f"{tournament} Team {team+1}"
+        if entry is not None and entry['hash'] == hashes[team] and entry['team'] == team_key and team_key in tournament_teams:
+            continue
+        changed.append(team)
+
+    parsed = parse_pokepastes(results, tournament, changed)
+    for team in changed:
+        series = results.iloc[team]
+        team_key = f"{tournament} Team {team+1}"
+        if team_key in parsed:
+            tournament_teams[team_key] = parsed[team_key]
+            url = None if pd.isna(series.iloc[2]) else series.iloc[2]
+            manifest.record(tournament, series.iloc[0], team_key, url, hashes[team])
+
+    print(f"{tournament}: {len(changed)} of {len(results)} teams parsed, {len(removed)} dropped")
+    return len(changed) + len(removed) + pruned
+
+#Brings the saved tournament pickles up to date with their csv files
+def ingest_tournaments(tournaments, manifest_path = ingest_manifest, revalidate = False):
+    manifest = Ingest_Manifest(manifest_path)
+
+    for tournament in tournaments:
+        results = pd.read_csv(os.path.join(regional_data, f"{tournament}.csv"))
+        pickle_path = os.path.join(regional_data, f"{tournament}.pkl")
+
+        tournament_teams = {}
+        seeded = False
+        if os.path.exists(pickle_path):
+            with open(pickle_path, 'rb') as file:
+                tournament_teams = pickle.load(file)
+            if tournament not in manifest.tournaments:
+                manifest.seed(tournament, results, tournament_teams)
+                seeded = True
+
+        if ingest_tournament(tournament, results, manifest, tournament_teams, revalidate) > 0:
+            with open(pickle_path, 'wb') as file:
+                pickle.dump(tournament_teams, file)
+            manifest.save()
+        elif seeded:
+            # Nothing changed, but the seeded entries are saved so the next run doesn't seed again
+            manifest.save()
+
+    return manifest
@@ -0,0 +1,43 @@
+import numpy as np
+from .move_table import move_table, move_categories
+
+#Sparse species x move learnset matrix in CSR form, row r holds the move ids indices[indptr[r]:indptr[r+1]]
+class Learnset_Matrix:
+    def __init__(self):
+        self.version = None
+        self.species_ids = {}
+        self.moves = []
+        self.categories = np.zeros(0, dtype = np.int8)
+        self.indptr = np.zeros(1, dtype = np.intp)
+        self.indices = np.zeros(0, dtype = np.intp)
+
+    def build(self, learnsets, revision):
+        """Columns are move table ids, moves the database doesn't know aren't legal like choose_move_set"""
+        table = move_table.sync()
+        move_ids = table.ids
+        self.moves = list(table.database.values())
+        self.categories = table['damage_class']
+
+        self.species_ids = {}
+        rows = []
+        for pokemon_name, learnset in learnsets.items():
+            self.species_ids[pokemon_name] = len(rows)
+            rows.append(np.sort(np.fromiter((move_ids[move] for move in learnset if move in move_ids), dtype = np.intp)))
+        self.indptr = np.concatenate([[0], np.cumsum([len(row) for row in rows])]).astype(np.intp)
+        self.indices = np.concatenate(rows) if rows else np.zeros(0, dtype = np.intp)
+        self.version = (revision, table.revision)
+
+    def row(self, learnsets, revision, pokemon_name):
+        """Move ids the pokemon can learn, rebuilds the matrix if the learnsets revision or the move table's revision moved on"""
+        if self.version != (revision, move_table.sync().revision):
+            self.build(learnsets, revision)
+        species = self.species_ids.get(pokemon_name)
+        if species is None:
+            return self.indices[:0]
+        return self.indices[self.indptr[species]:self.indptr[species + 1]]
+
+    def pools(self, learnsets, revision, pokemon_name):
+        """The status, physical and special moves the pokemon can learn, as lists of move info"""
+        row = self.row(learnsets, revision, pokemon_name)
+        categories = self.categories[row]
+        return [[self.moves[move] for move in row[categories == category].tolist()] for category in range(len(move_categories))]
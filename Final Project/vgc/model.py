@@ -0,0 +1,48 @@
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import KBinsDiscretizer
+from imblearn.over_sampling import SMOTE
+from sklearn.feature_selection import RFE
+from sklearn.model_selection import cross_val_score, StratifiedKFold
+from imblearn.pipeline import Pipeline
+import warnings
+warnings.filterwarnings('ignore')
+
+#ML Model
+def random_forest_classifer(X_train, y_train, X_test, y_test):
+    print(f"Size of the training data: {np.shape(X_train)}\nSize of the test data: {np.shape(X_test)}")
+    rf = RandomForestClassifier(
+        n_estimators=1000,
+        random_state=42,
+        max_depth=None,
+        min_samples_split=10,
+        min_samples_leaf=8,
+        class_weight='balanced',
+        bootstrap=True,
+        oob_score=True,
+        n_jobs=-1
+    )
+
+    discretizer = KBinsDiscretizer(n_bins=4, encode='ordinal', strategy='kmeans')
+    y_train_cat = discretizer.fit_transform(np.array(y_train).reshape(-1, 1)).ravel()
+    y_test_cat = discretizer.transform(np.array(y_test).reshape(-1, 1)).ravel()
+
+    pipeline = Pipeline([
+        ('smote', SMOTE(random_state=42, k_neighbors=min(5, np.min(np.bincount(y_train_cat.astype(int)))-1))),
+        ('rfe', RFE(estimator=RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1), 
+                    n_features_to_select=10)),
+        ('classifier', rf)
+    ])
+
+    pipeline.fit(X_train, y_train_cat)
+    
+    predictions = pipeline.predict(X_test)
+
+    # Evaluate using cross-validation
+    cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
+    scores = cross_val_score(pipeline, X_train, y_train_cat, cv=cv, scoring='accuracy')
+    print("Cross-validation scores:", scores)
+
+    mask = pipeline.named_steps['rfe'].support_
+
+    return predictions, rf, y_test_cat, mask
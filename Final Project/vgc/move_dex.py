@@ -0,0 +1,169 @@
+import random
+import json
+import os
+
+#Stores different information about the moves
+class Move_Dex:
+    def __init__(self):
+        self.move_database = {}
+        # Moves PokeAPI doesn't have are saved so they're never asked for again, failed requests are only skipped this run
+        self.missing_moves = set()
+        self.failed_moves = set()
+        self.missing_path = None
+    
+    def register_move(self, move_info):
+        """Register a Move in the database"""
+        self.move_database[move_info['name'].lower()] = move_info
+
+    def load_moves(self, data):
+        self.move_database = data
+
+    def load_missing(self, path):
+        self.missing_path = path
+        if os.path.exists(path):
+            with open(path, 'r') as file:
+                self.missing_moves = set(json.load(file))
+
+    def save_missing(self):
+        if self.missing_path is None:
+            return
+        temp = f"{self.missing_path}.tmp"
+        with open(temp, 'w') as file:
+            json.dump(sorted(self.missing_moves), file)
+        os.replace(temp, self.missing_path)
+
+    def add_missing(self, move_names, saved):
+        if len(move_names) == 0:
+            return
+        if saved:
+            self.missing_moves.update(move_names)
+            self.save_missing()
+        else:
+            self.failed_moves.update(move_names)
+
+    def known(self, move_name):
+        """True if the move is in the database or is known to be missing from PokeAPI"""
+        return move_name in self.move_database or move_name in self.missing_moves or move_name in self.failed_moves
+
+    def display_move_info(self, move_name):
+        move_info = self.move_database[move_name]
+        print(f"Name: {move_info['name']}")
+        print(f"Accuracy: {move_info['accuracy']}")
+        print(f"Damage Type: {move_info['damage_type']}")
+        print(f"Power: {move_info['power']}")
+        print(f"Priority: {move_info['priority']}")
+        print(f"Target: {move_info['target']}")
+        print(f"Type: {move_info['type']}")
+        print(f"Ailment: {move_info['ailment_name']}")
+        print(f"Ailment Chance: {move_info['ailment_chance']}")
+        print(f"Crit Rate: {move_info['crit_rate']}")
+        print(f"Drain: {move_info['drain']}")
+        print(f"Flinch Chance: {move_info['flinch_chance']}")
+        print(f"Healing: {move_info['healing']}")
+        print(f"Max Hits: {move_info['max_hits']}")
+        print(f"Max Turns: {move_info['max_turns']}")
+        print(f"Min Hits: {move_info['min_hits']}")
+        print(f"Min Turns: {move_info['min_turns']}")
+        print(f"Stat Chance: {move_info['stat_chance']}")
+        if len(move_info['stat_changes']) > 0:
+            for i in range(len(move_info['stat_changes'])):
+                dict = move_info['stat_changes'][i]
+                print(f"Stat Changes: {dict['change']} {dict['stat']['name']}")
+        else:
+            print("Stat Changes: None")
+
+    def rate_move(self, move_name, poke_info):
+        """One entry of the precomputed rating table, picked by the move, the member's roles and STAB"""
+        # move_table imports move_dex, so it's only imported once a move is rated
+        from .move_table import move_table, role_mask
+        move_info = self.get_move_info(move_name)
+        # A move that couldn't be found rates 1 like a move the formula couldn't read
+        if move_info is None:
+            return 1
+        stab = move_info.get('type') in poke_info['types']
+        return float(move_table.ratings()[move_table.resolve([move_name])[0], role_mask(poke_info['roles']), int(stab)])
+
+    def choose_move_set(self, roles, move_list = None, status_flag = True, pools = None):
+        """pools is (status, physical, special) from pokedex.move_pools, otherwise they're found by scanning the database for move_list"""
+        moves = []
+
+        if pools is not None:
+            status_moves, physical_moves, special_moves = pools
+        else:
+            status_moves = []
+            physical_moves = []
+            special_moves = []
+
+            if not isinstance(move_list, (set, frozenset)):
+                move_list = set(move_list)
+
+            for move in self.move_database:
+                if move in move_list:
+                    if self.move_database[move]['damage_type'] == 'status':
+                        status_moves.append(self.move_database[move])
+                    if self.move_database[move]['damage_type'] == 'physical':
+                        physical_moves.append(self.move_database[move])
+                    if self.move_database[move]['damage_type'] == 'special':
+                        special_moves.append(self.move_database[move])
+
+        if status_flag == False:
+            atk = 4
+        elif 'bulky' in roles:
+            atk = random.randint(1,3)
+        else:
+            atk = random.randint(2,4)
+
+        if 'attacker' in roles:
+            rest = 4 - atk
+            moves = random.sample(physical_moves, k = atk)
+            if rest > 0:
+                moves.extend(random.sample(status_moves, k = rest))
+        elif 'sp_attacker' in roles:
+            rest = 4 - atk
+            moves = random.sample(special_moves, k = atk)
+            if rest > 0:
+                moves.extend(random.sample(status_moves, k = rest))
+        else:
+            rest = 4 - atk
+            moves = random.sample(status_moves, k = atk)
+            if rest > 0:
+                moves.extend(random.sample((special_moves + physical_moves), k = rest))
+        
+        return moves
+
+    def get_move_info(self, move_name):
+        """Move info from the database, None if PokeAPI doesn't have the move or the request failed"""
+        if not self.known(move_name):
+            try:
+                # scraping brings in requests and bs4, so it's only imported once the network is needed
+                from .scraping import get_api_move_info
+                move = get_api_move_info(move_name)
+                if move is None:
+                    print(f"{move_name} is not in the API")
+                    self.add_missing([move_name], saved = True)
+                else:
+                    self.register_move(move)
+            except Exception as e:
+                print(f"Couldn't get {move_name}: {e}")
+                self.add_missing([move_name], saved = False)
+        return self.move_database.get(move_name)
+
+    def resolve_moves(self, move_names):
+        """Fetches every move of a batch the database doesn't know in one concurrent pass, so scoring never waits on PokeAPI"""
+        unknown = [move for move in dict.fromkeys(move_names) if isinstance(move, str) and not self.known(move)]
+        if len(unknown) == 0:
+            return []
+
+        from .scraping import get_api_moves
+        found, missing = get_api_moves(unknown)
+        for move_name, move in found.items():
+            self.register_move(move)
+            # PokeAPI answered with a different name, asking for this one will never work
+            if move_name not in self.move_database:
+                missing[move_name] = True
+
+        self.add_missing([move for move, saved in missing.items() if saved], saved = True)
+        self.add_missing([move for move, saved in missing.items() if not saved], saved = False)
+        return [move for move in found if move in self.move_database]
+
+move_dex = Move_Dex()
@@ -0,0 +1,241 @@
+import os
+import numpy as np
+from .move_dex import move_dex
+from .type_chart import type_chart
+
+#Damage classes in the order of their codes
+move_categories = ['status', 'physical', 'special']
+
+#Numeric fields of the move database, each becomes a float column with nan where the API had nothing
+number_columns = ['power', 'accuracy', 'priority', 'crit_rate', 'drain', 'flinch_chance', 'healing', 'ailment_chance',
+                  'stat_chance', 'min_hits', 'max_hits', 'min_turns', 'max_turns']
+
+#Every column of the table, a saved table missing one of them is built again
+table_columns = number_columns + ['type', 'damage_class', 'target', 'ailment', 'stat_change_count', 'stat_changes']
+
+#Bits of the roles that change a move's rating, a member's roles become one index into the rating table
+role_bits = {'attacker': 1, 'sp_attacker': 2, 'bulky': 4}
+
+#Attacking types rate_move counts as strong
+strong_types = ['poison', 'dark', 'ghost', 'water', 'ground', 'fire', 'fighting', 'bug', 'ice', 'flying', 'rock']
+
+#Role bitmask of a list of roles
+def role_mask(roles):
+    mask = 0
+    for role in roles:
+        mask |= role_bits.get(role, 0)
+    return mask
+
+#Moves behind each of the team tactic features, every flag is one bit of a move's bitfield
+flag_moves = {
+    'speed_control': ['icy-wind', 'trick-room', 'tailwind', 'electroweb', 'bulldoze', 'thunder-wave', 'dragon-dance', 'quiver-dance'],
+    'pivot': ['baton-pass', 'chilly-reception', 'flip-turn', 'parting-shot', 'shed-tail', 'teleport', 'u-turn', 'volt-switch'],
+    'screen': ['reflect', 'light-screen', 'aurora-veil'],
+    'multi_hit': ['arm-thrust', 'barrage', 'bone-rush', 'bullet-seed', 'comet-punch', 'double-slap', 'fury-attack', 'fury-swipes',
+                  'icicle-spear', 'pin-missile', 'rock-blast', 'scale-shot', 'spike-cannon', 'tail-slap', 'water-shuriken'],
+    'recovery': ['synthesis', 'morning-sun', 'moonlight'],
+    'sets_sun': ['sunny-day'],
+    'sets_rain': ['rain-dance'],
+    'sets_hail': ['snowscape', 'chilly-reception'],
+    'sets_sand': ['sandstorm'],
+    'sun_boosted': ['solar-beam', 'solar-blade', 'growth'],
+    'rain_boosted': ['thunder', 'hurricane'],
+    'hail_boosted': ['blizzard', 'aurora-veil'],
+    'sand_weakened': ['solar-beam'],
+    'sets_grass': ['grassy-terrain'],
+    'sets_psychic': ['psychic-terrain'],
+    'sets_electric': ['electric-terrain'],
+    'sets_mist': ['misty-terrain'],
+    'grass_boosted': ['nature-power', 'terrain-pulse', 'grassy-glide'],
+    'grass_weakened': ['earthquake', 'bulldoze', 'magnitude'],
+    'psychic_boosted': ['nature-power', 'terrain-pulse', 'expanding-force'],
+    'electric_boosted': ['nature-power', 'rising-voltage', 'terrain-pulse'],
+    'mist_boosted': ['nature-power', 'terrain-pulse']
+}
+flag_bits = {flag: 1 << i for i, flag in enumerate(flag_moves)}
+
+#Bitfield of each flagged move by name, for moves the table doesn't have yet
+move_flag_bits = {}
+for flag, moves in flag_moves.items():
+    for move in moves:
+        move_flag_bits[move] = move_flag_bits.get(move, 0) | flag_bits[flag]
+
+#The move database's mix of strings, ints, None and nan as one float
+def to_number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+#Code of a string field in a growing vocabulary, -1 for a missing value
+def to_code(value, vocabulary):
+    if not isinstance(value, str):
+        return -1
+    if value not in vocabulary:
+        vocabulary.append(value)
+    return vocabulary.index(value)
+
+#Every move as one row of typed columns, the row of a move is its id and follows the move database order
+class Move_Table:
+    def __init__(self):
+        self.names = []
+        self.ids = {}
+        self.targets = []
+        self.ailments = []
+        self.columns = {}
+        self.database = None
+        self.size = 0
+        self.rating_table = None
+        self.flag_table = None
+        # Goes up every time the table is built or loaded, anything built from the ids compares against it
+        self.revision = 0
+
+    def build(self, move_database):
+        self.names = list(move_database)
+        self.targets = []
+        self.ailments = []
+        moves = list(move_database.values())
+
+        self.columns = {column: np.array([to_number(move.get(column)) for move in moves]) for column in number_columns}
+        self.columns['type'] = np.array([type_chart.type_ids.get(move.get('type'), -1) for move in moves], dtype = np.int8)
+        self.columns['damage_class'] = np.array([move_categories.index(move.get('damage_type')) if move.get('damage_type') in move_categories else -1
+                                                 for move in moves], dtype = np.int8)
+        self.columns['target'] = np.array([to_code(move.get('target'), self.targets) for move in moves], dtype = np.int16)
+        self.columns['ailment'] = np.array([to_code(move.get('ailment_name'), self.ailments) for move in moves], dtype = np.int16)
+
+        # Moves PokeAPI has no meta for only have a name, their missing fields read like None
+        # Stat changes padded with nan to the most any move has, a change that isn't a number is nan too
+        width = max([len(move.get('stat_changes', [])) for move in moves], default = 0)
+        self.columns['stat_change_count'] = np.array([len(move.get('stat_changes', [])) for move in moves], dtype = np.int8)
+        self.columns['stat_changes'] = np.full((len(moves), width), np.nan)
+        for i, move in enumerate(moves):
+            for j, change in enumerate(move.get('stat_changes', [])):
+                self.columns['stat_changes'][i, j] = to_number(change['change'])
+
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.database = move_database
+        self.size = len(move_database)
+        self.rating_table = None
+        self.flag_table = None
+        self.revision += 1
+
+    def sync(self):
+        """Rebuilds from move_dex if the database was replaced or get_move_info added moves, returns the table"""
+        if self.database is not move_dex.move_database or self.size != len(move_dex.move_database):
+            self.build(move_dex.move_database)
+        return self
+
+    def save(self, path):
+        np.savez_compressed(path, names = np.array(self.names), targets = np.array(self.targets), ailments = np.array(self.ailments),
+                            **self.columns)
+
+    def load(self, path):
+        """Reads a saved table, it's only used while its moves are the moves of the database"""
+        with np.load(path) as file:
+            names = file['names'].tolist()
+            if names != list(move_dex.move_database) or not set(table_columns) <= set(file.files):
+                return False
+            self.names = names
+            self.targets = file['targets'].tolist()
+            self.ailments = file['ailments'].tolist()
+            self.columns = {column: file[column] for column in table_columns}
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.database = move_dex.move_database
+        self.size = len(self.names)
+        self.rating_table = None
+        self.flag_table = None
+        self.revision += 1
+        return True
+
+    def move_ids(self, move_names):
+        """Ids of many moves, -1 for moves that aren't in the table"""
+        return np.array([self.ids.get(move, -1) for move in move_names], dtype = np.intp)
+
+    def resolve(self, move_names):
+        """Ids of many moves, moves the table doesn't have go through get_move_info first like the dict lookups did"""
+        self.sync()
+        missing = [move for move in move_names if move not in self.ids]
+        if missing:
+            for move in missing:
+                move_dex.get_move_info(move)
+            self.sync()
+        return self.move_ids(move_names)
+
+    def ratings(self):
+        """rate_move of every move for every role bitmask and STAB, (moves, 8, 2), worked out the first time it's needed"""
+        self.sync()
+        if self.rating_table is None:
+            self.rating_table = rate_moves(self)
+        return self.rating_table
+
+    def flags(self):
+        """Flag bitfield of every move, built the first time it's needed"""
+        self.sync()
+        if self.flag_table is None:
+            self.flag_table = np.array([move_flag_bits.get(move, 0) for move in self.names], dtype = np.int64)
+        return self.flag_table
+
+    def move_flags(self, move_names):
+        """Ids and flag bitfields of many moves, moves the table doesn't have are -1 and still get their flags"""
+        # Synced before the ids are read so they index the same table as the flags
+        self.sync()
+        ids = self.move_ids(move_names)
+        flags = np.where(ids >= 0, self.flags()[ids], 0)
+        for i in np.flatnonzero(ids < 0).tolist():
+            flags[i] = move_flag_bits.get(move_names[i], 0)
+        return ids, flags
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+#rate_move over the whole table at once, the same multiplicative formula with the role and STAB factors as the last two axes
+def rate_moves(table):
+    accuracy = table['accuracy']
+    power = table['power']
+    priority = table['priority']
+    damage_class = table['damage_class']
+    max_hits = table['max_hits']
+
+    rate = np.where((damage_class != 0) & np.isin(table['type'], [type_chart.type_ids[attack_type] for attack_type in strong_types]), 1.5, 1.0)
+    rate = rate*np.where(accuracy > 0, accuracy/100, 1)
+    rate = rate*np.where(power > 0, 1 + power/100, 1)
+    rate = rate*np.where(priority > 0, 1 + priority/10, np.where(priority < 0, 1 - priority/10, 1))
+    selected = table.targets.index('selected-pokemon') if 'selected-pokemon' in table.targets else -2
+    rate = rate*np.where(table['target'] != selected, 1.5, 1)
+    no_ailment = table.ailments.index('none') if 'none' in table.ailments else -2
+    has_ailment = table['ailment'] != no_ailment
+    rate = rate*np.where(has_ailment, 1 + table['ailment_chance']/100, 1)
+    rate = rate*(1 + table['crit_rate'])*(1 + table['drain']/100)*(1 + table['flinch_chance']/100)*(1 + table['healing']/100)
+    multi_hit = max_hits > 0
+    with np.errstate(invalid = 'ignore'):
+        rate = rate*np.where(multi_hit, max_hits*(accuracy/100)**(max_hits - 1), 1)
+
+    changes = table['stat_changes']
+    counted = np.arange(changes.shape[1]) < table['stat_change_count'][:, None]
+    factors = np.where(changes < 0, np.abs(0.9*changes), 1.1*changes)
+    rate = rate*np.where(counted, factors, 1).prod(axis = 1)
+
+    # Anything rate_move would have failed to read in its try/except rates 1
+    unreadable = (np.isnan(priority) | (has_ailment & np.isnan(table['ailment_chance'])) | np.isnan(table['crit_rate'])
+                  | np.isnan(table['drain']) | np.isnan(table['flinch_chance']) | np.isnan(table['healing'])
+                  | (multi_hit & np.isnan(accuracy)) | (counted & np.isnan(changes)).any(axis = 1))
+
+    # Role factors over the 8 role bitmasks and the STAB factor of damaging moves
+    masks = np.arange(8)
+    role = np.ones((len(rate), 8))
+    for bit, category in [(role_bits['attacker'], 1), (role_bits['sp_attacker'], 2), (role_bits['bulky'], 0)]:
+        role = role*np.where((damage_class[:, None] == category) & (masks & bit > 0), 1.5, 1)
+    stab = np.stack([np.ones(len(rate)), np.where(damage_class != 0, 1.1, 1)], axis = 1)
+
+    ratings = rate[:, None, None]*role[:, :, None]*stab[:, None, :]
+    ratings[unreadable] = 1
+    return ratings
+
+#Loads the saved table if its moves are the moves of the database, otherwise builds it in memory without touching the file
+def load_move_table(path):
+    if os.path.exists(path) and move_table.load(path):
+        return move_table
+    move_table.build(move_dex.move_database)
+    return move_table
+
+move_table = Move_Table()
@@ -0,0 +1,156 @@
+import requests
+import pandas as pd
+from .fetching import fetch_engine
+from .pokedex import pokedex
+from .scraping import pikalytics, pikalytics_many
+from .showdown import showdown_blocks, read_showdown_set, parse_showdown_exports
+from .sampling import set_sampler
+
+#Reads pokepastes
+def parse_pokepaste(series, index = 1):
+    if pd.isna(series.iloc[2]):
+        return read_pokepaste(series)
+
+    try:
+        response = fetch_engine.get(f"{series.iloc[2]}/raw")
+        response.raise_for_status()
+    except requests.RequestException as e:
+        return f"Error fetching data: {e}. Team Number:{index}"
+
+    return read_pokepaste(series, response.text)
+
+#Reads every pokepaste of a tournament (or only the given rows), fetching the pastes and missing pokemon concurrently
+def parse_pokepastes(results, tournament, rows = None):
+    if rows is None:
+        rows = range(len(results))
+
+    missing = set()
+    for team in rows:
+        series = results.iloc[team]
+        if pd.isna(series.iloc[2]):
+            missing.update(name for name in series.iloc[3:9] if name not in pokedex.pokemon_database)
+
+    for name, pokemon in pikalytics_many(missing).items():
+        if pokemon is not None:
+            pokedex.register_pokemon(pokemon)
+
+    urls = [f"{results.iloc[team, 2]}/raw" for team in rows if not pd.isna(results.iloc[team, 2])]
+    responses = fetch_engine.get_many(urls)
+
+    tournament_teams = {}
+    for team in rows:
+        series = results.iloc[team]
+        try:
+            if pd.isna(series.iloc[2]):
+                text = None
+            else:
+                text = fetch_engine.check(responses[f"{series.iloc[2]}/raw"]).text
+            tournament_teams[f"{tournament} Team {team+1}"] = read_pokepaste(series, text)
+        except:
+            print('===',tournament, team+1,'===')
+
+    return tournament_teams
+
+#The listed member of a team a set belongs to, the first one whose name before any '-' is in the set's header
+def listed_member(names, header):
+    return next((name for name in names if name.split('-')[0].lower() in header), None)
+
+#Reads a team from its pokepaste text, teams without a paste get filled in from pikalytics
+def read_pokepaste(series, text = None):
+    if text is None:
+        placement = series.iloc[0]
+        cp = series.iloc[1]
+        names = [series.iloc[i] for i in range(3,9)]
+        team = {}
+
+        for i, name in enumerate(names):
+            if name not in pokedex.pokemon_database:
+                pokemon = pikalytics(name)
+                if pokemon is not None:
+                    pokedex.register_pokemon(pokemon)
+
+            team[f"Member {i+1}"] = pokedex.create_pokepaste(name)
+        
+        team['placement'] = int(placement)
+        team['cp'] = float(cp)/500
+
+        return team
+
+    else:
+        placement = series.iloc[0]
+        cp = series.iloc[1]
+        names = [series.iloc[i] for i in range(3,9)]
+        stats = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+
+        team = {}
+
+        for j, block in enumerate(showdown_blocks(text)):
+            name_part, item, ability, tera, nature, evs, ivs, moves = read_showdown_set(block)
+            name = listed_member(names, name_part)
+
+            team[f"Member {j+1}"] = {
+                'name': name,
+                'item': item,
+                'ability': ability,
+                'tera_type': tera,
+                'evs': dict(zip(stats, evs)),
+                'nature': nature,
+                'ivs': dict(zip(stats, ivs)),
+                'moves': moves
+            }
+        
+        team['placement'] = int(placement)
+        team['cp'] = float(cp)/500
+
+        return team
+
+#k imputed versions of a team without a paste, every member's sets are drawn in one batch from the seed's stream for its species
+def impute_teams(series, k, seed = None):
+    placement = series.iloc[0]
+    cp = series.iloc[1]
+    names = [series.iloc[i] for i in range(3,9)]
+
+    for name in names:
+        if name not in pokedex.pokemon_database:
+            pokemon = pikalytics(name)
+            if pokemon is not None:
+                pokedex.register_pokemon(pokemon)
+
+    member_sets = set_sampler.sample_many(names, k, seed)
+    teams = []
+    for j in range(k):
+        team = {f"Member {i+1}": sets[j] for i, sets in enumerate(member_sets)}
+        team['placement'] = int(placement)
+        team['cp'] = float(cp)/500
+        teams.append(team)
+
+    return teams
+
+#Columnar records for every pasted team of a tournament, pastes come from the response cache when they're there
+def parse_tournament_exports(results, tournament):
+    urls = {}
+    for team in range(len(results)):
+        if not pd.isna(results.iloc[team, 2]):
+            urls[f"{tournament} Team {team+1}"] = f"{results.iloc[team, 2]}/raw"
+    responses = fetch_engine.get_many(urls.values())
+
+    texts = {}
+    for team_key, url in urls.items():
+        try:
+            texts[team_key] = fetch_engine.check(responses[url]).text
+        except requests.RequestException as e:
+            print(f"Error fetching data: {e}. {team_key}")
+
+    members = parse_showdown_exports(texts)
+
+    # Members are matched to the listed names on the set's header with the same helper as read_pokepaste
+    rows = {f"{tournament} Team {team+1}": results.iloc[team] for team in range(len(results))}
+    names = []
+    for paste, header in zip(members['paste'], members['header']):
+        names.append(listed_member([rows[paste].iloc[i] for i in range(3,9)], header))
+
+    members.insert(2, 'name', names)
+    members.insert(1, 'placement', [int(rows[paste].iloc[0]) for paste in members['paste']])
+    members.insert(2, 'cp', [float(rows[paste].iloc[1])/500 for paste in members['paste']])
+
+    return members
@@ -0,0 +1,11 @@
+import os
+
+#The data folders sit next to the package, so the code runs from any working directory
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+class_data = os.path.join(project_dir, 'Class Data')
+regional_data = os.path.join(project_dir, 'Regional Data')
+missing_moves = os.path.join(class_data, 'missing_moves.json')
+usage_csv = os.path.join(project_dir, 'usage.csv')
+http_cache = os.path.join(project_dir, 'HTTP Cache')
+team_store = os.path.join(regional_data, 'Team Store')
+ingest_manifest = os.path.join(regional_data, 'manifest.json')
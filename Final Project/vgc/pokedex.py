@@ -0,0 +1,543 @@
+import numpy as np
+import random
+from typing import Dict
+from .type_chart import type_chart
+from .move_dex import move_dex
+from .learnsets import Learnset_Matrix
+from .aliases import species_aliases
+
+#Stat order of every stat array
+stat_names = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+
+# Nature effects: +10% to one stat, -10% to another
+nature_effects = {
+    'Hardy': {'attack': 1.0, 'attack': 1.0},
+    'Lonely': {'attack': 1.1, 'defense': 0.9},
+    'Brave': {'attack': 1.1, 'speed': 0.9},
+    'Adamant': {'attack': 1.1, 'sp_attack': 0.9},
+    'Naughty': {'attack': 1.1, 'sp_defense': 0.9},
+    'Bold': {'defense': 1.1, 'attack': 0.9},
+    'Docile': {'defense': 1.0, 'defense': 1.0},
+    'Relaxed': {'defense': 1.1, 'speed': 0.9},
+    'Impish': {'defense': 1.1, 'sp_attack': 0.9},
+    'Lax': {'defense': 1.1, 'sp_defense': 0.9},
+    'Timid': {'speed': 1.1, 'attack': 0.9},
+    'Hasty': {'speed': 1.1, 'defense': 0.9},
+    'Serious': {'speed': 1.0, 'speed': 1.0},
+    'Jolly': {'speed': 1.1, 'sp_attack': 0.9},
+    'Naive': {'speed': 1.1, 'sp_defense': 0.9},
+    'Modest': {'sp_attack': 1.1, 'attack': 0.9},
+    'Mild': {'sp_attack': 1.1, 'defense': 0.9},
+    'Quiet': {'sp_attack': 1.1, 'speed': 0.9},
+    'Bashful': {'sp_attack': 1.0, 'sp_attack': 1.0},
+    'Rash': {'sp_attack': 1.1, 'sp_defense': 0.9},
+    'Calm': {'sp_defense': 1.1, 'attack': 0.9},
+    'Gentle': {'sp_defense': 1.1, 'defense': 0.9},
+    'Sassy': {'sp_defense': 1.1, 'speed': 0.9},
+    'Careful': {'sp_defense': 1.1, 'sp_attack': 0.9},
+    'Quirky' : {'sp_defense': 1.0, 'sp_defense': 1.0}
+}
+
+#Modifier of each stat for each nature, row i is nature_names[i]
+nature_names = list(nature_effects)
+nature_matrix = np.ones((25, 6))
+for i, nature in enumerate(nature_names):
+    for stat, modifier in nature_effects[nature].items():
+        nature_matrix[i, stat_names.index(stat)] = modifier
+
+#Row of the nature in nature_matrix, natures that aren't in the table change nothing like Hardy
+def nature_id(nature):
+    try:
+        return nature_names.index(nature)
+    except ValueError:
+        return 0
+
+#Level 50 stats of any number of pokemon in one call, base_stats, evs and ivs are integer arrays whose last axis is
+#stat_names and natures are nature ids, everything broadcasts so (species, 1, 6) against (1, spreads, 6) gives every pair
+def batch_final_stats(base_stats, evs, ivs, natures):
+    base_stats = np.asarray(base_stats, dtype = np.int64)
+    evs = np.asarray(evs, dtype = np.int64)
+    ivs = np.asarray(ivs, dtype = np.int64)
+    modifiers = nature_matrix[np.asarray(natures)]
+
+    stats = ((2*base_stats + ivs + evs//4)*50)//100 + 5
+    # int() of the float product, the same truncation as calculate_other_stat
+    stats = (stats*modifiers).astype(np.int64)
+    # HP always uses a 31 iv and has no nature
+    stats[..., 0] = ((2*base_stats[..., 0] + 31 + evs[..., 0]//4)*50)//100 + 60
+    return stats
+
+#Species level data, one shared object per pokemon that every instance of it points to
+class Species:
+    __slots__ = ('name', 'types', 'base_stats', 'bst', 'defensive_coverage', 'stab_coverage', 'defensive_bits', 'stab_bits')
+
+    def __init__(self, name, base_data):
+        self.name = name
+        self.types = base_data['types']
+        self.base_stats = base_data['base_stats']
+        self.bst = base_data['base_stat_total']
+        self.defensive_coverage = base_data['def_coverage']
+        self.stab_coverage = base_data['stab_coverage']
+        self.defensive_bits = type_chart.shared_def_bits(self.types)
+        self.stab_bits = type_chart.shared_stab_bits(self.types)
+
+#One pokemon on a team, only what differs between instances is stored and the rest is read from its species
+#member['key'] reads like the old instance dicts, stats and evs are kept as tuples in stat_names order
+class Member:
+    __slots__ = ('species', 'item', 'ability', 'tera', 'tera_coverage', 'roles', 'nature', 'evs', 'ivs', 'stats', 'max_stat', 'min_stat', 'moves')
+    species_fields = frozenset(Species.__slots__)
+    stat_fields = frozenset(['evs', 'ivs', 'stats'])
+
+    def __init__(self, species, item, ability, tera, tera_coverage, roles, nature, evs, stats, max_stat, min_stat, moves, ivs = None):
+        self.species = species
+        self.item = item
+        self.ability = ability
+        self.tera = tera
+        self.tera_coverage = tera_coverage
+        self.roles = roles
+        self.nature = nature
+        self.evs = tuple(evs[stat] for stat in stat_names)
+        self.stats = tuple(stats[stat] for stat in stat_names)
+        self.max_stat = max_stat
+        self.min_stat = min_stat
+        self.moves = moves
+        # Instances loaded from pastes never had ivs
+        if ivs is not None:
+            self.ivs = tuple(ivs[stat] for stat in stat_names)
+
+    def __getitem__(self, key):
+        if key in Member.species_fields:
+            return getattr(self.species, key)
+        try:
+            value = getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+        if key in Member.stat_fields:
+            return dict(zip(stat_names, value))
+        return value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+#Stores information about each pokemon
+class Pokedex:
+    def __init__(self):
+        self.pokemon_database = {}
+        self.learnsets = {}
+        # Goes up every time the learnsets change, the learnset matrix is rebuilt when it's behind
+        self.learnset_revision = 0
+        self.learnset_matrix = Learnset_Matrix()
+        self.species_cache = {}
+    
+    def register_pokemon(self, poke_info):
+        """Register a Pokemon in the database"""
+        if poke_info['name'].lower() not in self.pokemon_database:
+            self.pokemon_database[poke_info['name'].lower()] = poke_info
+        else:
+            print("Pokemon already in database")
+
+    def delete_pokemon(self, pokemon_name):
+        del self.pokemon_database[pokemon_name]
+        self.species_cache.pop(pokemon_name, None)
+
+    def load_database(self, database):
+        # Databases saved before the alias table can hold a species under its scraped name as well as its id
+        self.pokemon_database = species_aliases.migrate(database)
+        self.species_cache = {}
+
+    def species(self, pokemon_name):
+        """Shared Species of a pokemon in the database, made the first time it's asked for"""
+        try:
+            return self.species_cache[pokemon_name]
+        except KeyError:
+            self.species_cache[pokemon_name] = Species(pokemon_name, self.pokemon_database[pokemon_name])
+            return self.species_cache[pokemon_name]
+
+    def load_learnsets(self, learnsets):
+        self.learnsets = species_aliases.migrate(learnsets)
+        self.learnset_revision += 1
+
+    def get_learnset(self, pokemon_name):
+        """Moves the pokemon can learn, only goes to PokeAPI if the pokemon isn't indexed yet"""
+        if pokemon_name not in self.learnsets:
+            # scraping brings in requests and bs4, so it's only imported once the network is needed
+            from .scraping import get_pokemon_moves
+            moves = get_pokemon_moves(pokemon_name)
+            if moves is None:
+                return set()
+            self.learnsets[pokemon_name] = set(moves)
+            self.learnset_revision += 1
+        return self.learnsets[pokemon_name]
+
+    def move_pools(self, pokemon_name):
+        """Status, physical and special moves the pokemon can learn, one row of the learnset matrix split by category"""
+        self.get_learnset(pokemon_name)
+        return self.learnset_matrix.pools(self.learnsets, self.learnset_revision, pokemon_name)
+
+    def load_instance(self, loaded):
+        pokemon_name = loaded['name'].lower()
+        if pokemon_name not in pokedex.pokemon_database:
+            from .scraping import pikalytics
+            pokemon = pikalytics(pokemon_name)
+            if pokemon is not None:
+                pokedex.register_pokemon(pokemon)
+
+        base_data = self.pokemon_database[pokemon_name]
+        base_stats = base_data['base_stats']
+        ability = loaded['ability']
+        item = loaded['item']
+        nature = loaded['nature']
+        tera = loaded['tera_type']
+        evs = loaded['evs']
+        ivs = loaded['ivs']
+        move_names = loaded['moves']
+
+        if tera == 'stellar':
+            tera_coverage = 'Offensive'
+        elif tera in base_data['types']:
+            tera_coverage = 'Offensive'
+        else:
+            tera_coverage = type_chart.shared_def_coverage([tera])
+
+        ev_tot = 0
+        if evs is not None:
+            for stat, ev in evs.items():
+                ev_tot += ev
+
+        if evs is None or ev_tot == 0:
+            #redo ivs for sp_attacker maybe speed iv too
+            evs_container = base_data['natures/evs']
+            if nature == None:
+                nature = evs_container[0]['nature']   
+            weight = [container['usage'] for container in evs_container]
+            evs_container = random.choices(evs_container, weights = weight, k = 1)
+            evs = dict(list(evs_container[0].items())[1:-1])
+
+        if ivs == None:
+            pre_role = self.get_nature_modifiers(nature.capitalize())
+            if 'sp_attacker' in pre_role:
+                if pre_role['sp_attacker'] == 1.1:
+                    ivs = {'hp': 31, 'attack': 0, 'defense': 31, 'sp_attack': 31, 'sp_defense': 31, 'speed': 31}
+            else:
+                ivs = {'hp': 31, 'attack': 31, 'defense': 31, 'sp_attack': 31, 'sp_defense': 31, 'speed': 31}
+
+        stats = self.calculate_final_stats(base_stats, evs, ivs, nature)
+        bst = base_data['base_stat_total']
+        roles = self.define_role(base_stats, bst, stats)
+
+        return Member(self.species(pokemon_name), item, ability, tera, tera_coverage, roles, nature, evs, stats,
+                      max_stat = max(stats, key = stats.get),
+                      min_stat = min(stats, key = stats.get),
+                      moves = move_names)
+
+    def define_role(self, base_stats, bst, stats):
+        roles = []
+
+        max_atk = max(['attack', 'sp_attack'], key = lambda stat: stats[stat])
+        bulk_score = (base_stats['hp'] + base_stats['defense'] + base_stats['sp_defense'])/3
+
+        if bst/6 <= base_stats[max_atk]:
+            roles.append(f'{max_atk}er')
+        if bst/6 <= bulk_score:
+            roles.append('bulky')
+        if bst/6 <= base_stats['speed']:
+            roles.append('speedy')
+
+        return roles
+
+    def create_pokepaste(self, pokemon_name):
+        if pokemon_name not in self.pokemon_database:
+            raise ValueError(f"Pokemon {pokemon_name} not found in database")
+        pokemon_data = self.pokemon_database[pokemon_name]
+
+        types = ['normal', 'fire', 'water', 'electric', 'grass', 'ice',  'fighting',
+                'poison', 'ground', 'flying', 'psychic', 'bug', 'rock', 
+                'ghost', 'dragon', 'dark', 'steel', 'fairy', 'stellar']
+
+        tera = random.choice(types)
+
+        items_container = pokemon_data['items']
+        weight = [container[-1] for container in items_container]
+        item = random.choices(items_container, weights = weight, k = 1)[0][0]
+
+        if pokemon_name != 'ursaluna-bloodmoon':
+            abilities_container = pokemon_data['abilities']
+            weight = [container[-1] for container in abilities_container]
+            ability = random.choices(abilities_container, weights = weight, k = 1)[0][0]
+        else:
+            ability = "mind's-eye"
+
+        moves_container = pokemon_data['moves']
+        weight = [container[-1] for container in moves_container]
+        moves = random.choices(moves_container, weights = weight, k = 4)
+        chosen_indices = np.random.choice(len(moves_container), size = 4, replace = False, p = np.array(weight)/sum(weight))
+        moves = [moves_container[move] for move in chosen_indices.tolist()]
+        moves = [move[0] for move in moves]
+
+        all_moves = sorted(self.get_learnset(pokemon_name))
+
+        for move in moves:
+            if move != 'other':
+                try:
+                    all_moves.remove(move)
+                except:
+                    pass
+
+        for i, move in enumerate(moves):
+            if move == 'other':
+                moves[i] = move.replace('other', random.choice(all_moves))
+
+        return {
+            'name': pokemon_data['name'],
+            'item': item,
+            'ability': ability,
+            'tera_type': tera,
+            'evs': None,
+            'nature': None,
+            'ivs': None,
+            'moves': moves
+        }
+
+    def create_instance(self, loaded_data):
+        pokemon_name = loaded_data['name']
+        pokemon_data = self.pokemon_database[pokemon_name]
+
+        types = ['normal', 'fire', 'water', 'electric', 'grass', 'ice',  'fighting',
+                'poison', 'ground', 'flying', 'psychic', 'bug', 'rock', 
+                'ghost', 'dragon', 'dark', 'steel', 'fairy', 'stellar']
+        base_stats = pokemon_data['base_stats']
+
+        tera = random.choice(types)
+        if pokemon_name != 'ursaluna-bloodmoon':
+            ability_container = pokemon_data['abilities']
+            ability = random.choice(ability_container)[0]
+        else:
+            ability = "mind's-eye"
+
+        item_container = pokemon_data['items']
+        item = random.choice(item_container)[0]
+
+        if tera == 'stellar':
+            tera_coverage = 'Offensive'
+        elif tera in pokemon_data['types']:
+            tera_coverage = 'Offensive'
+        else:
+            tera_coverage = type_chart.shared_def_coverage([tera])
+
+        nature = self.get_random_nature()   
+        bst = pokemon_data['base_stat_total']
+
+        evs = self.generate_random_evs(nature)
+
+        pre_role = self.get_nature_modifiers(nature.capitalize())
+
+        if 'sp_attacker' in pre_role:
+            if pre_role['sp_attacker'] == 1.1:
+                ivs = {'hp': 31, 'attack': 0, 'defense': 31, 'sp_attack': 31, 'sp_defense': 31, 'speed': 31}
+        else:
+            ivs = {'hp': 31, 'attack': 31, 'defense': 31, 'sp_attack': 31, 'sp_defense': 31, 'speed': 31}
+
+        stats = self.calculate_final_stats(base_stats, evs, ivs, nature)
+
+        roles = self.define_role(base_stats, bst, stats)
+
+        moves = move_dex.choose_move_set(roles, pools = self.move_pools(pokemon_name))
+        move_names = [move['name'] for move in moves]
+
+        return Member(self.species(pokemon_name), item, ability, tera, tera_coverage, roles, nature, evs, stats,
+                      max_stat = max(dict(list(stats.items())[1:]), key = stats.get),
+                      min_stat = min(dict(list(stats.items())[1:]), key = stats.get),
+                      moves = move_names,
+                      ivs = ivs)
+    
+    def generate_random_evs(self, nature) -> Dict[str, int]:
+        """Generate random EV spread that sums to 510 or less"""
+        stats = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+        evs = {stat: 0 for stat in stats}
+        nature_stats = list(self._get_nature_modifiers(nature))
+        if len(nature_stats) == 1:
+            prioritized_stats = random.sample(stats, random.randint(2, 3))
+        else: 
+            stats.pop(stats.index(nature_stats[0]))
+            stats.pop(stats.index(nature_stats[1]))
+            prioritized_stats = random.sample(stats, random.randint(1, 2))
+            prioritized_stats.append(nature_stats[0])
+        leftover_stats = [stat for stat in stats if stat not in prioritized_stats]
+
+        remaining_evs = 510
+        # Distribute EVs to prioritized stats first (in multiples of 8 for efficiency)
+        for stat in prioritized_stats:
+            if remaining_evs <= 0:
+                break
+            
+            # At level 50, we want EVs in multiples of 8 for efficiency
+            max_possible = min(252, remaining_evs)
+            # Round down to nearest multiple of 8
+            max_evs = (max_possible // 8) * 8
+
+            if len(prioritized_stats) == 3:
+                if max_evs > 168:
+                    # Choose a multiple of 8 between 0 and max_evs
+                    ev_options = list(range(104, 169, 8))
+                    chosen_evs = random.choice(ev_options)
+                    evs[stat] = chosen_evs
+                    remaining_evs -= chosen_evs
+            else:
+                if max_evs > 168:
+                    # Choose a multiple of 8 between 0 and max_evs
+                    ev_options = list(range(168, max_evs + 1, 8))
+                    chosen_evs = random.choice(ev_options)
+                    evs[stat] = chosen_evs
+                    remaining_evs -= chosen_evs
+        
+        # Distribute remaining EVs randomly in efficient chunks
+        while remaining_evs > 0:
+            stat = random.choice(leftover_stats)
+            # Add in chunks of 8 EVs for efficiency at level 50
+            max_add = min(252 - evs[stat], remaining_evs)
+            max_add = (max_add // 8) * 8  # Round down to multiple of 8
+            
+            if max_add > 0:
+                add_evs = random.choice([8, 16, 24, 32, 40, 48])  # Common efficient amounts
+                add_evs = min(add_evs, max_add)
+                evs[stat] += add_evs
+                remaining_evs -= add_evs
+            else:
+                # If we can't add efficient chunks, just use what's left
+                evs[stat] += remaining_evs
+                remaining_evs = 0
+        return evs
+
+    def generate_random_evs(self, nature) -> Dict[str, int]:
+        """Generate random EV spread that sums to 510 or less"""
+        stats = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+        evs = {stat: 0 for stat in stats}
+        nature_stats = list(self.get_nature_modifiers(nature))
+        if len(nature_stats) == 1:
+            prioritized_stats = random.sample(stats, random.randint(2, 3))
+        else: 
+            stats.pop(stats.index(nature_stats[0]))
+            stats.pop(stats.index(nature_stats[1]))
+            prioritized_stats = random.sample(stats, random.randint(1, 2))
+            prioritized_stats.append(nature_stats[0])
+        leftover_stats = [stat for stat in stats if stat not in prioritized_stats]
+
+        remaining_evs = 510
+        # Distribute EVs to prioritized stats first (in multiples of 8 for efficiency)
+        for stat in prioritized_stats:
+            if remaining_evs <= 0:
+                break
+            
+            # At level 50, we want EVs in multiples of 8 for efficiency
+            max_possible = min(252, remaining_evs)
+            # Round down to nearest multiple of 8
+            max_evs = (max_possible // 8) * 8
+
+            if len(prioritized_stats) == 3:
+                if max_evs > 168:
+                    # Choose a multiple of 8 between 0 and max_evs
+                    ev_options = list(range(104, 169, 8))
+                    chosen_evs = random.choice(ev_options)
+                    evs[stat] = chosen_evs
+                    remaining_evs -= chosen_evs
+            else:
+                if max_evs > 168:
+                    # Choose a multiple of 8 between 0 and max_evs
+                    ev_options = list(range(168, max_evs + 1, 8))
+                    chosen_evs = random.choice(ev_options)
+                    evs[stat] = chosen_evs
+                    remaining_evs -= chosen_evs
+        
+        # Distribute remaining EVs randomly in efficient chunks
+        while remaining_evs > 0:
+            stat = random.choice(leftover_stats)
+            # Add in chunks of 8 EVs for efficiency at level 50
+            max_add = min(252 - evs[stat], remaining_evs)
+            max_add = (max_add // 8) * 8  # Round down to multiple of 8
+            
+            if max_add > 0:
+                add_evs = random.choice([8, 16, 24, 32, 40, 48])  # Common efficient amounts
+                add_evs = min(add_evs, max_add)
+                evs[stat] += add_evs
+                remaining_evs -= add_evs
+            else:
+                # If we can't add efficient chunks, just use what's left
+                evs[stat] += remaining_evs
+                remaining_evs = 0
+        return evs
+
+    def get_random_nature(self) -> str:
+        """Get a random nature"""
+        natures = [
+            'Hardy', 'Lonely', 'Brave', 'Adamant', 'Naughty',
+            'Bold', 'Docile', 'Relaxed', 'Impish', 'Lax',
+            'Timid', 'Hasty', 'Serious', 'Jolly', 'Naive',
+            'Modest', 'Mild', 'Quiet', 'Bashful', 'Rash',
+            'Calm', 'Gentle', 'Sassy', 'Careful', 'Quirky'
+        ]
+        return random.choice(natures)
+
+    def calculate_final_stats(self, base_stats: Dict[str, int], evs: Dict[str, int],  ivs: Dict[str, int],
+                            nature: str) -> Dict[str, int]:
+        """Calculate final stats considering base stats, EVs, IVs, nature, and level"""
+        stats = batch_final_stats([base_stats[stat] for stat in stat_names],
+                                  [evs[stat] for stat in stat_names],
+                                  [ivs[stat] if stat != 'hp' else 31 for stat in stat_names],
+                                  nature_id(nature.capitalize()))
+        stats = dict(zip(stat_names, stats.tolist()))
+        return {stat: stats[stat] for stat in base_stats}
+    
+    def calculate_hp_stat(self, base: int, ev: int) -> int:
+        """Calculate HP stat"""
+        # HP formula: ((2 * Base + IV + EV/4) * Level) / 100 + Level + 10
+        return ((2 * base + 31 + ev // 4) * 50) // 100 + 50 + 10
+    
+    def calculate_other_stat(self, base: int, ev: int, iv: int, nature_modifier: float) -> int:
+        """Calculate other stats (Attack, Defense, etc.)"""
+        # Other stats formula: (((2 * Base + IV + EV/4) * 50) / 100 + 5) * Nature
+        stat_value = ((2 * base + iv + ev // 4) * 50) // 100 + 5
+        return int(stat_value * nature_modifier)
+    
+    def get_nature_modifiers(self, nature: str) -> Dict[str, float]:
+        """Get stat modifiers for a given nature"""
+        return nature_effects.get(nature, {})
+
+    def print_pokemon_details(self, pokemon_instance: Dict):
+        """Pretty print Pokemon details"""
+        print(f"\n=== {pokemon_instance['name'].capitalize()} ===")
+        print(f"Type: {', '.join(pokemon_instance['types'])}")
+        print("\nDefensive Coverage:")
+        for type, coverage in pokemon_instance['defensive_coverage'].items():
+            print(f"  {type.upper()}: {", ".join(coverage)}")
+        print("\nStab Coverage:")
+        for type, coverage in pokemon_instance['stab_coverage'].items():
+            print(f"  {type.upper()}: {", ".join(coverage)}")
+        print(f"\nTera Type: {pokemon_instance['tera']}")
+        print("Tera Coverage:")
+        if pokemon_instance['tera_coverage'] == 'Offensive':
+            print("  Tera is offensive")
+        else:
+            for type, coverage in pokemon_instance['tera_coverage'].items():
+                print(f"  {type.upper()}: {", ".join(coverage)}")
+        print("\nRoles")
+        print(f"  {", ".join(pokemon_instance['roles'])}")
+        print(f"\nNature: {pokemon_instance['nature']}")
+        print("EVs:")
+        ev_tot = 0
+        for stat, ev in pokemon_instance['evs'].items():
+            print(f"  {stat.upper()}: {ev}")
+            ev_tot += ev
+        print("Total EVs: ",ev_tot)
+        print("\nStats:")
+        for stat, value in pokemon_instance['stats'].items():
+            print(f"  {stat.upper()}: {value}")
+        print(f"BST: {pokemon_instance['bst']}, Max Stat: {pokemon_instance['max_stat']}, Min Stat: {pokemon_instance['min_stat']}")
+        print("\nMoves:")
+        for move in pokemon_instance['moves']:
+            print(f"  {move.replace('-',' ').capitalize()}")
+
+pokedex = Pokedex()
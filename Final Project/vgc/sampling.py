@@ -0,0 +1,153 @@
+import hashlib
+import numpy as np
+from .pokedex import pokedex
+
+tera_types = ['normal', 'fire', 'water', 'electric', 'grass', 'ice',  'fighting',
+              'poison', 'ground', 'flying', 'psychic', 'bug', 'rock',
+              'ghost', 'dragon', 'dark', 'steel', 'fairy', 'stellar']
+
+#Stable integer key of a name, unlike hash() it's the same in every process
+def name_key(name):
+    return int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], 'big')
+
+#A generator for each name from one seed, a stream only depends on the seed, the name and how many times the name came before it
+def species_generators(seed, pokemon_names):
+    # Drawn once so a seed of None still gives every name in the call the same entropy
+    entropy = np.random.SeedSequence(seed).entropy
+    seen = {}
+    generators = []
+    for name in pokemon_names:
+        occurrence = seen.get(name, 0)
+        seen[name] = occurrence + 1
+        generators.append(np.random.default_rng(np.random.SeedSequence(entropy, spawn_key = (name_key(name), occurrence))))
+    return generators
+
+#Walker/Vose alias table, draws from a weighted list in constant time per draw
+class Alias_Table:
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype = float)
+        if len(weights) == 0 or weights.sum() <= 0:
+            raise ValueError("An alias table needs at least one positive weight")
+        n = len(weights)
+        scaled = weights*n/weights.sum()
+        self.prob = np.ones(n)
+        self.alias = np.arange(n)
+        self.support = int((weights > 0).sum())
+
+        small = [i for i in range(n) if scaled[i] < 1]
+        large = [i for i in range(n) if scaled[i] >= 1]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+        # Whatever is left is 1 up to rounding and keeps prob 1
+
+    def sample(self, rng, size):
+        index = rng.integers(0, len(self.prob), size = size)
+        return np.where(rng.random(size) < self.prob[index], index, self.alias[index])
+
+    def sample_distinct(self, rng, size, k):
+        """size rows of k different entries, each slot is drawn from what the earlier slots left like np.random.choice(replace = False)"""
+        if self.support < k:
+            raise ValueError(f"Can't draw {k} different entries from {self.support}")
+        chosen = np.empty((size, k), dtype = np.intp)
+        for slot in range(k):
+            draw = self.sample(rng, size)
+            clash = (draw[:, None] == chosen[:, :slot]).any(axis = 1)
+            while clash.any():
+                draw[clash] = self.sample(rng, int(clash.sum()))
+                clash = (draw[:, None] == chosen[:, :slot]).any(axis = 1)
+            chosen[:, slot] = draw
+        return chosen
+
+#Alias tables of every species' items, abilities, moves and spreads from its pikalytics usage, built once per species
+class Species_Tables:
+    def __init__(self, pokemon_name, pokemon_data):
+        self.pokemon_data = pokemon_data
+        self.items = [container[0] for container in pokemon_data['items']]
+        self.item_table = Alias_Table([container[-1] for container in pokemon_data['items']])
+        if pokemon_name != 'ursaluna-bloodmoon':
+            self.abilities = [container[0] for container in pokemon_data['abilities']]
+            self.ability_table = Alias_Table([container[-1] for container in pokemon_data['abilities']])
+        else:
+            self.abilities = ["mind's-eye"]
+            self.ability_table = Alias_Table([1])
+        self.moves = [container[0] for container in pokemon_data['moves']]
+        self.move_table = Alias_Table([container[-1] for container in pokemon_data['moves']])
+        self.spreads = pokemon_data['natures/evs']
+        self.spread_table = Alias_Table([container['usage'] for container in self.spreads])
+        # 'other' moves are filled from the learnset like create_pokepaste
+        self.learnset = sorted(pokedex.get_learnset(pokemon_name))
+        learnset_ids = {move: i for i, move in enumerate(self.learnset)}
+        self.move_learnset_ids = np.array([learnset_ids.get(move, -1) for move in self.moves], dtype = np.intp)
+        self.other = self.moves.index('other') if 'other' in self.moves else -1
+
+#Draws complete sets (item, ability, tera, spread, moves) for many pokemon at once
+class Set_Sampler:
+    def __init__(self):
+        self.tables = {}
+
+    def species_tables(self, pokemon_name):
+        pokemon_data = pokedex.pokemon_database[pokemon_name]
+        tables = self.tables.get(pokemon_name)
+        # The database can be reloaded, tables are only reused while they were built from the same entry
+        if tables is None or tables.pokemon_data is not pokemon_data:
+            tables = Species_Tables(pokemon_name, pokemon_data)
+            self.tables[pokemon_name] = tables
+        return tables
+
+    def fill_other(self, tables, moves, rng):
+        """Replace 'other' with uniform learnset moves the set doesn't already have, sets with nothing left keep 'other'"""
+        other = moves == tables.other
+        if tables.other < 0 or not other.any() or len(tables.learnset) == 0:
+            return [[tables.moves[move] for move in row] for row in moves.tolist()]
+
+        taken = np.where(other, -1, tables.move_learnset_ids[moves])
+        available = len(tables.learnset) - (taken >= 0).sum(axis = 1)
+        rows, slots = np.nonzero(other & (available[:, None] > 0))
+        fill = rng.integers(0, len(tables.learnset), size = len(rows))
+        clash = (fill[:, None] == taken[rows]).any(axis = 1)
+        while clash.any():
+            fill[clash] = rng.integers(0, len(tables.learnset), size = int(clash.sum()))
+            clash = (fill[:, None] == taken[rows]).any(axis = 1)
+
+        names = [[tables.moves[move] for move in row] for row in moves.tolist()]
+        for row, slot, move in zip(rows.tolist(), slots.tolist(), fill.tolist()):
+            names[row][slot] = tables.learnset[move]
+        return names
+
+    def sample(self, pokemon_name, k, rng):
+        """k complete sets of one pokemon in the format of create_pokepaste, ready for load_instance"""
+        tables = self.species_tables(pokemon_name)
+        items = tables.item_table.sample(rng, k)
+        abilities = tables.ability_table.sample(rng, k)
+        teras = rng.integers(0, len(tera_types), size = k)
+        spreads = tables.spread_table.sample(rng, k)
+        moves = self.fill_other(tables, tables.move_table.sample_distinct(rng, k, 4), rng)
+
+        sets = []
+        for i in range(k):
+            spread = tables.spreads[spreads[i]]
+            sets.append({
+                'name': tables.pokemon_data['name'],
+                'item': tables.items[items[i]],
+                'ability': tables.abilities[abilities[i]],
+                'tera_type': tera_types[teras[i]],
+                'evs': dict(list(spread.items())[1:-1]),
+                'nature': spread['nature'],
+                'ivs': None,
+                'moves': moves[i]
+            })
+        return sets
+
+    def sample_many(self, pokemon_names, k, seed = None):
+        """k sets for each pokemon, each draws from the stream of its name so a species' sets don't depend on the rest of the list"""
+        return [self.sample(name, k, rng) for name, rng in zip(pokemon_names, species_generators(seed, pokemon_names))]
+
+set_sampler = Set_Sampler()
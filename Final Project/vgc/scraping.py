@@ -0,0 +1,396 @@
+import requests
+import time
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+from .fetching import fetch_engine
+from .aliases import species_aliases
+from .type_chart import type_chart
+from .move_dex import move_dex
+
+#lxml builds trees much faster than html.parser, fall back to html.parser without it
+try:
+    import lxml
+    fast_parser = 'lxml'
+except ImportError:
+    fast_parser = 'html.parser'
+
+#Championship points for each placement
+cp_lookup = {'1': 350,
+             '2': 325,
+             '3': 300,
+             '4': 300,
+             '5': 280,
+             '6': 280,
+             '7': 280,
+             '8': 280,
+             '9': 160,
+             '10': 160,
+             '11': 160,
+             '12': 160,
+             '13': 160,
+             '14': 160,
+             '15': 160,
+             '16': 160,
+             '17': 125,
+             '18': 125,
+             '19': 125,
+             '20': 125,
+             '21': 125,
+             '22': 125,
+             '23': 125,
+             '24': 125,
+             '25': 125,
+             '26': 125,
+             '27': 125,
+             '28': 125,
+             '29': 125,
+             '30': 125,
+             '31': 125,
+             '32': 125
+            }
+
+#Decorator for scrapping
+def scrape(func):  
+    def wrap(*args, **kwargs):
+        if 'html' in args[0]:
+            match = re.search(r'/([^/]+)\.html$', args[0])
+            tournament = match.group(1)
+            result =' '.join(word.title() for word in tournament.split('-'))
+        else:
+            result = args[0]
+        print(f"Getting info for {result}")
+        return func(*args, **kwargs)
+    return wrap  
+
+#PokeAPI url of a move
+def move_url(move_name):
+    return f"https://pokeapi.co/api/v2/move/{move_name.lower()}/"
+
+#Move database entry from the PokeAPI json of a move
+def read_api_move(move_data):
+    if move_data["meta"] == None:
+        return {"name": move_data["name"]}
+    return {
+        "name": move_data["name"],
+        "accuracy": move_data["accuracy"],
+        "damage_type": move_data["damage_class"]["name"],
+        "power": move_data["power"],
+        "priority": move_data["priority"],
+        "target": move_data["target"]["name"],
+        "type": move_data["type"]["name"],
+        "ailment_name": move_data["meta"]["ailment"]["name"],
+        "ailment_chance": move_data["meta"]["ailment_chance"],
+        "crit_rate": move_data["meta"]["crit_rate"],
+        "drain": move_data["meta"]["drain"],
+        "flinch_chance": move_data["meta"]["flinch_chance"],
+        "healing": move_data["meta"]["healing"],
+        "max_hits": move_data["meta"]["max_hits"],
+        "max_turns": move_data["meta"]["max_turns"],
+        "min_hits": move_data["meta"]["min_hits"],
+        "min_turns": move_data["meta"]["min_turns"],
+        "stat_chance": move_data["meta"]["stat_chance"],
+        "stat_changes": move_data["stat_changes"],
+    }
+
+#Used if pokelytics does not have move information needed, None only if PokeAPI doesn't have the move, other failures raise
+def get_api_move_info(move_name):
+    if move_name not in move_dex.move_database:
+        response = fetch_engine.get(move_url(move_name))
+        if response.status_code == 404:
+            return None
+        return read_api_move(fetch_engine.check(response).json())
+
+#Many moves from PokeAPI in one concurrent pass, returns {move: move info}, {move: True if PokeAPI doesn't have it, False if the request failed}
+def get_api_moves(move_names):
+    urls = {name: move_url(name) for name in move_names}
+    responses = fetch_engine.get_many(urls.values())
+    found = {}
+    missing = {}
+
+    for name, url in urls.items():
+        response = responses[url]
+        if isinstance(response, Exception):
+            print(f"Couldn't get {name}: {response}")
+            missing[name] = False
+        elif response.status_code == 200:
+            found[name] = read_api_move(response.json())
+        else:
+            missing[name] = response.status_code == 404
+
+    return found, missing
+
+#Get information about the pokemon movesets
+def get_pokemon_moves(pokemon_name):
+    url = f"https://pokeapi.co/api/v2/pokemon/{species_aliases.slug(pokemon_name, 'pokeapi')}"
+    response = fetch_engine.get(url)
+
+    if response.status_code == 200:
+        pokemon_data = response.json()
+
+        return [move["move"]["name"] for move in pokemon_data["moves"]]
+    
+    else:
+        return None
+
+#Builds the learnset index {pokemon: set of moves} with one concurrent pass over PokeAPI
+def build_learnsets(pokemon_names):
+    urls = {name: f"https://pokeapi.co/api/v2/pokemon/{species_aliases.slug(name, 'pokeapi')}" for name in pokemon_names}
+    responses = fetch_engine.get_many(urls.values())
+    learnsets = {}
+
+    for name, url in urls.items():
+        try:
+            response = fetch_engine.check(responses[url])
+            learnsets[name] = {move["move"]["name"] for move in response.json()["moves"]}
+        except requests.RequestException as e:
+            print(f"No learnset for {name}: {e}")
+
+    return learnsets
+
+#Pikalytics page of a pokemon
+def pikalytics_url(pokemon_name):
+    return f"https://www.pikalytics.com/pokedex/gen9vgc2025reghbo3/{species_aliases.slug(pokemon_name, 'pikalytics')}"
+
+#Scrapes pikalytics
+@scrape
+def pikalytics(pokemon_name):
+    try:
+        response = fetch_engine.get(pikalytics_url(pokemon_name))
+        response.raise_for_status()
+
+        return read_pikalytics(pokemon_name, response.content)
+
+    except requests.RequestException as e:
+        print(f"Error fetching data: {e}")
+    except (IndexError, AttributeError, ValueError) as e:
+        print(f"Error reading {pokemon_name}: {e}")
+
+#Scrapes pikalytics for many pokemon at once, returns {name: info or None}
+def pikalytics_many(pokemon_names):
+    urls = {name: pikalytics_url(name) for name in pokemon_names}
+    responses = fetch_engine.get_many(urls.values())
+    pokemon = {}
+
+    for name, url in urls.items():
+        print(f"Getting info for {name}")
+        try:
+            response = fetch_engine.check(responses[url])
+            pokemon[name] = read_pikalytics(name, response.content)
+        except requests.RequestException as e:
+            print(f"Error fetching data: {e}")
+            pokemon[name] = None
+        except (IndexError, AttributeError, ValueError) as e:
+            print(f"Error reading {name}: {e}")
+            pokemon[name] = None
+
+    return pokemon
+
+#Only the stat containers and the type header of a pikalytics page are read
+pikalytics_strainer = SoupStrainer('div', class_=re.compile('pokemon-stat-container|content-div-header-font'))
+
+#Reads a pikalytics page, fast only builds the parts of the page that get read
+def read_pikalytics(pokemon_name, content, fast = True):
+    stat_names = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+    if fast:
+        soup = BeautifulSoup(content, fast_parser, parse_only = pikalytics_strainer)
+    else:
+        soup = BeautifulSoup(content, 'html.parser')
+    container = soup.find_all('div', class_='inline-block pokemon-stat-container')
+
+    moves = []
+    partners = []
+    items = []
+    abilities = []
+    evs = []
+
+    stats_container = container[0].select('div[style*="display:inline-block;vertical-align: middle;margin-left: 20px;"]')
+    moves_container = container[1].find_all('div', class_='pokedex-move-entry-new')
+    partners_container = container[2].find_all('a', class_='teammate_entry')
+    items_container = container[3].find_all('div', class_='pokedex-move-entry-new')
+    abilities_container = container[4].find_all('div', class_='pokedex-move-entry-new')
+    evs_container = container[5].find_all('div', class_='pokedex-move-entry-new')
+
+    stats = [int(div.get_text(strip=True)) for div in stats_container]
+    base_stats = {stat_name: stat for stat_name, stat in zip(stat_names, stats)}
+
+    for move in moves_container:
+        move_info = move.find_all('div', style=lambda value: 'inline-block' in value)
+        moves.append([move_info[0].text.replace(' ', '-').lower(), float(move_info[2].text.replace('%',''))/100])
+    
+    for partner in partners_container:
+        partner_info = partner.find_all('div', style=lambda value: 'inline-block' in value)
+        partners.append([partner_info[2].text.strip().replace(' ', '-').lower(), float(partner_info[-1].text.replace('%',''))/100])
+    
+    for item in items_container:
+        item_info = item.find_all('div', style=lambda value: 'inline-block' in value)
+        items.append([item_info[2].text.replace(' ', '-').lower(), float(item_info[3].text.replace('%',''))/100])
+    
+    for ability in abilities_container:
+        ability_info = ability.find_all('div', style=lambda value: 'inline-block' in value)
+        abilities.append([ability_info[0].text.replace(' ', '-').lower(), float(ability_info[1].text.replace('%',''))/100])
+    
+    for ev in evs_container:
+        ev_info = ev.find_all('div', style=lambda value: 'inline-block' in value)
+        ev_holder = {}
+        ev_holder['nature'] = ev_info[0].text.replace(' ', '-').lower()
+        for i, stat in enumerate(stat_names):
+            ev_holder[stat] = int(ev_info[i+1].text.strip().replace('/',''))
+        ev_holder['usage'] = float(ev_info[-1].text.strip().replace('%',''))/100
+        evs.append(ev_holder)
+
+    types_container = soup.find('div', class_= 'inline-block content-div-header-font')
+    types = [type.text for type in types_container.find_all('span', class_='type')]
+
+    pokemon_info = {
+        'name': pokemon_name,
+        'types': types,
+        'base_stats': base_stats,
+        'moves': moves,
+        'partners': partners,
+        'items': items,
+        'abilities': abilities,
+        'natures/evs': evs
+    }
+
+    pokemon_info['def_coverage'] = type_chart.def_coverage(pokemon_info['types'])
+    pokemon_info['stab_coverage'] = type_chart.get_stab_coverage(pokemon_info['types'])
+
+    bst = 0
+    for stat, value in pokemon_info['base_stats'].items():
+        bst += value
+    pokemon_info['base_stat_total'] = bst
+
+    return pokemon_info
+
+#Not used      
+def nimbasacitypost_regulation_h_sample_teams():
+    details = []
+    try:
+        url = 'https://www.nimbasacitypost.com/2025/08/regulation-h-sample-teams.html'
+        response = fetch_engine.get(url)
+        response.raise_for_status()
+
+        soup = BeautifulSoup(response.content, 'html.parser')
+        target_rows = soup.find_all('tr', style=lambda value: value and 'height: 0pt' in value)
+
+        for target in target_rows:
+            info = target.find_all('td', style=lambda value: value and 'background-color' in value)
+            img_tags = info[2].find_all('img')
+            team = [species_aliases.canonical(img.get('alt')) for img in img_tags]
+
+            try:
+                details.append([info[1].get_text(strip = True), team, info[3].find('a')['href']])
+            except: pass
+        
+        return details
+
+    except requests.RequestException as e:
+        print(f"Error fetching data: {e}")
+
+#Scrapping for teams
+@scrape
+def nimbasacity_results(url):
+    try:
+        response = fetch_engine.get(url)
+        response.raise_for_status()
+
+        return read_nimbasacity_results(url, response.content)
+
+    except requests.RequestException as e:
+        print(f"Error fetching data: {e}")
+
+#Scrapes many tournament pages at once, returns {url: details or None}
+def nimbasacity_results_many(urls):
+    responses = fetch_engine.get_many(urls)
+    results = {}
+
+    for url, response in responses.items():
+        try:
+            response = fetch_engine.check(response)
+            results[url] = read_nimbasacity_results(url, response.content)
+        except requests.RequestException as e:
+            print(f"Error fetching data: {e}")
+            results[url] = None
+
+    return results
+
+#Only the table rows of a tournament page are read
+nimbasacity_strainer = SoupStrainer('tr')
+
+#Reads the teams from a tournament page, fast only builds the table rows
+def read_nimbasacity_results(url, content, fast = True):
+    details = []
+    if fast:
+        soup = BeautifulSoup(content, fast_parser, parse_only = nimbasacity_strainer)
+    else:
+        soup = BeautifulSoup(content, 'html.parser')
+
+    if 'regional' or 'international' in url:
+        target_rows = soup.find_all('tr', class_=lambda x: x and 'player-result' in x)
+
+        for target in target_rows:
+            info = target.find_all('td', style=lambda x: x and 'text-align' in x)
+            placement = info[0].text
+            cp = int(info[2].text)
+            try:
+                href = info[1].find('a')['href']
+            except:
+                break
+            img_tags = info[4].find_all('img')
+            team = [species_aliases.canonical(img.get('alt')) for img in img_tags]
+
+            try:
+                details.append([placement, cp, team, href])
+            except: pass
+
+
+    if 'special' or 'premier' in url:
+        target_rows = soup.find_all('tr', style=lambda x: x and 'height: 0pt' in x)
+        for target in target_rows[1:]:
+            info = target.find_all('span', style=lambda x: x and 'font-family: inherit' in x)
+            placement = info[0].text
+
+            if placement in cp_lookup:
+                cp = cp_lookup[placement]
+            else:
+                cp = 0
+
+            try:
+                href = target.find('a')['href']
+            except:
+                href = None
+
+            team_info = target.find_all('p', dir='ltr')
+            img_tags = team_info[3].find_all('img')
+            team = [species_aliases.canonical(img.get('alt')) for img in img_tags]
+
+            try:
+                details.append([placement, cp, team, href])
+            except: pass
+    
+    return details
+
+#Pages per second of the full html.parser tree against the fast path, using pages already in the cache
+def benchmark_parsers(pokemon_names = (), tournament_urls = (), repeat = 3):
+    """So far only timed on synthetic pages shaped like the real ones, run it after a real scrape for the speedup on real pages"""
+    pages = [(read_pikalytics, name, fetch_engine.cache.read(pikalytics_url(name))) for name in pokemon_names]
+    pages += [(read_nimbasacity_results, url, fetch_engine.cache.read(url)) for url in tournament_urls]
+    pages = [page for page in pages if page[2] is not None]
+    if len(pages) == 0:
+        print("No cached pages to benchmark")
+        return None
+
+    rates = {}
+    results = {}
+    for fast in [False, True]:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            results[fast] = [reader(key, content, fast = fast) for reader, key, content in pages]
+        rates[fast] = repeat*len(pages)/(time.perf_counter() - start)
+
+    mismatches = sum(old != new for old, new in zip(results[False], results[True]))
+    print(f"Pages: {len(pages)}, mismatched results: {mismatches}")
+    print(f"html.parser: {rates[False]:.1f} pages/s")
+    print(f"{fast_parser} + strainer: {rates[True]:.1f} pages/s ({rates[True]/rates[False]:.1f}x)")
+
+    return rates
@@ -0,0 +1,98 @@
+import re
+from .aliases import species_aliases
+
+#Showdown export patterns, compiled once and shared by every paste
+showdown_split = re.compile(r'\r?\n(?:[ \t]*\r?\n)+')
+showdown_line = re.compile(r'^[ \t]*(?:(Ability|Tera Type|EVs|IVs):[ \t]*(.*?)|- (.*?)|(.*?) Nature.*?)[ \t]*\r?$', re.M)
+showdown_stat = re.compile(r'(\d+)[ \t]*(hp|atk|def|spa|spd|spe)\b', re.I)
+showdown_gender = re.compile(r'\s*\((?:M|F)\)\s*$', re.I)
+showdown_species = re.compile(r'\(([^()]+)\)\s*$')
+showdown_stat_index = {'hp': 0, 'atk': 1, 'def': 2, 'spa': 3, 'spd': 4, 'spe': 5}
+
+#Splits an export into the text of each set
+def showdown_blocks(text):
+    return [block for block in showdown_split.split(text.strip()) if block.strip()]
+
+#Reads one set of a Showdown export with a single scan over its lines
+def read_showdown_set(block):
+    first_line, _, rest = block.partition('\n')
+    name_part, _, item = first_line.partition('@')
+    name_part = name_part.strip().lower()
+    item = item.strip().replace(' ','-').lower()
+
+    ability = None
+    tera = None
+    nature = None
+    evs = [0, 0, 0, 0, 0, 0]
+    ivs = [31, 31, 31, 31, 31, 31]
+    moves = []
+
+    for key, value, move, nature_name in showdown_line.findall(rest):
+        if move:
+            moves.append(move.lower().replace(' ','-'))
+        elif key == 'Ability':
+            ability = value.lower().replace(' ','-')
+        elif key == 'Tera Type':
+            tera = value.lower()
+        elif key == 'EVs':
+            for amount, stat in showdown_stat.findall(value):
+                evs[showdown_stat_index[stat.lower()]] = int(amount)
+        elif key == 'IVs':
+            for amount, stat in showdown_stat.findall(value):
+                ivs[showdown_stat_index[stat.lower()]] = int(amount)
+        elif nature_name:
+            nature = nature_name.strip().lower()
+
+    return name_part, item, ability, tera, nature, evs, ivs, moves
+
+#Species of a set from its header, without the nickname or gender
+def showdown_species_name(name_part):
+    name_part = showdown_gender.sub('', name_part)
+    species = showdown_species.search(name_part)
+    return (species.group(1) if species else name_part).strip().replace(' ','-')
+
+#Reads a whole export into the team dict Teams takes, each member is named by its species
+def read_showdown_team(text, placement = 0, cp = 0):
+    stats = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+    team = {}
+
+    for j, block in enumerate(showdown_blocks(text)):
+        name_part, item, ability, tera, nature, evs, ivs, moves = read_showdown_set(block)
+        team[f"Member {j+1}"] = {
+            'name': species_aliases.showdown(showdown_species_name(name_part)),
+            'item': item,
+            'ability': ability,
+            'tera_type': tera,
+            'evs': dict(zip(stats, evs)),
+            'nature': nature,
+            'ivs': dict(zip(stats, ivs)),
+            'moves': moves
+        }
+
+    team['placement'] = placement
+    team['cp'] = cp
+
+    return team
+
+showdown_columns = ['paste', 'slot', 'species', 'header', 'item', 'ability', 'tera_type', 'nature',
+                    'hp_ev', 'attack_ev', 'defense_ev', 'sp_attack_ev', 'sp_defense_ev', 'speed_ev',
+                    'hp_iv', 'attack_iv', 'defense_iv', 'sp_attack_iv', 'sp_defense_iv', 'speed_iv',
+                    'move_1', 'move_2', 'move_3', 'move_4']
+
+#Parses many Showdown exports ({key: text} or a list of texts) into one row per team member, header is the lowercase text before the item
+def parse_showdown_exports(texts):
+    import pandas as pd
+    if not isinstance(texts, dict):
+        texts = dict(enumerate(texts))
+    rows = []
+
+    for paste, text in texts.items():
+        if text is None:
+            continue
+        for slot, block in enumerate(showdown_blocks(text)):
+            name_part, item, ability, tera, nature, evs, ivs, moves = read_showdown_set(block)
+            species = showdown_species_name(name_part)
+            moves = (moves + [None, None, None, None])[:4]
+            rows.append((paste, slot + 1, species, name_part, item, ability, tera, nature, *evs, *ivs, *moves))
+
+    return pd.DataFrame.from_records(rows, columns = showdown_columns)
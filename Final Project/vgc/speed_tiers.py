@@ -0,0 +1,68 @@
+import numpy as np
+from .pokedex import pokedex, stat_names, nature_id, batch_final_stats
+from . import data
+
+#Sorted final speeds of the usage weighted meta, every species in usage.csv with each of its pikalytics spreads
+class Speed_Tiers:
+    def __init__(self):
+        self.usage = None
+        self.speeds = np.zeros(0, dtype = np.int64)
+        self.cumulative = np.zeros(1)
+
+    def build(self, usage):
+        """A spread weighs the species' average usage times its share of the species' spreads"""
+        speeds = []
+        weights = []
+        for pokemon_name, months in usage.items():
+            pokemon_data = pokedex.pokemon_database.get(pokemon_name)
+            if pokemon_data is None or not pokemon_data.get('natures/evs'):
+                continue
+            spreads = pokemon_data['natures/evs']
+            spread_usage = np.array([spread['usage'] for spread in spreads], dtype = float)
+            if spread_usage.sum() <= 0:
+                continue
+            base_stats = [pokemon_data['base_stats'][stat] for stat in stat_names]
+            evs = [[spread[stat] for stat in stat_names] for spread in spreads]
+            natures = [nature_id(spread['nature'].capitalize()) for spread in spreads]
+            speeds.append(batch_final_stats(base_stats, evs, [31]*6, natures)[:, 5])
+            weights.append(months['Average Usage']*spread_usage/spread_usage.sum())
+
+        self.usage = usage
+        if not speeds:
+            self.speeds = np.zeros(0, dtype = np.int64)
+            self.cumulative = np.zeros(1)
+            return
+        speeds = np.concatenate(speeds)
+        weights = np.concatenate(weights)
+        order = np.argsort(speeds, kind = 'stable')
+        self.speeds = speeds[order]
+        # cumulative[i] is the weight of the i slowest spreads, so a searchsorted position reads the weight below it
+        self.cumulative = np.concatenate([[0.0], np.cumsum(weights[order])])
+
+    def index(self):
+        """Builds the index the first time and again only if the usage table was reloaded"""
+        data.load_data()
+        if self.usage is not data.usage:
+            self.build(data.usage)
+        return self
+
+    def slower(self, speeds):
+        """Fraction of the meta strictly slower than each speed"""
+        total = self.cumulative[-1]
+        if total <= 0:
+            return np.zeros(np.shape(speeds))
+        return self.cumulative[np.searchsorted(self.speeds, speeds, side = 'left')]/total
+
+    def faster(self, speeds):
+        """Fraction of the meta strictly faster than each speed"""
+        total = self.cumulative[-1]
+        if total <= 0:
+            return np.zeros(np.shape(speeds))
+        return 1 - self.cumulative[np.searchsorted(self.speeds, speeds, side = 'right')]/total
+
+    def outspeed(self, speeds):
+        """Fraction of the meta each speed moves before at neutral speed, under its own Tailwind and under Trick Room"""
+        speeds = np.asarray(speeds, dtype = np.int64)
+        return np.stack([self.slower(speeds), self.slower(2*speeds), self.faster(speeds)], axis = -1)
+
+speed_tiers = Speed_Tiers()
@@ -0,0 +1,109 @@
+import numpy as np
+from .pokedex import pokedex, stat_names, nature_names, nature_id, batch_final_stats
+from .move_dex import move_dex
+from .type_chart import type_chart
+
+#Every legal amount of EVs in one stat, in 4 EV steps
+ev_steps = np.arange(0, 253, 4)
+max_evs = 508
+
+#Damage of a hit at level 50 with the highest roll, flooring after each step like the games do
+#attack and defense broadcast against each other so a whole grid of defenses is one call
+def hit_damage(power, attack, defense, modifier = 1.0):
+    base = (22*power*np.asarray(attack))//np.asarray(defense)
+    base = base//50 + 2
+    return np.floor(base*modifier).astype(np.int64)
+
+#A hit to survive from an attacker with a given spread, STAB, type effectiveness against the defender and spread moves go into the modifier
+def make_hit(attacker_name, move_name, defender_name, evs = 252, nature = None, spread = False):
+    move_info = move_dex.get_move_info(move_name)
+    if move_info is None:
+        raise ValueError(f"{move_name} isn't in the move database")
+    try:
+        power = int(float(move_info['power']))
+    except (TypeError, ValueError):
+        power = 0
+    if move_info['damage_type'] == 'status' or power <= 0:
+        raise ValueError(f"{move_name} isn't a damaging move with a power")
+    attacker = pokedex.pokemon_database[attacker_name]
+    stat = 'attack' if move_info['damage_type'] == 'physical' else 'sp_attack'
+    if nature is None:
+        nature = 'adamant' if stat == 'attack' else 'modest'
+    attack_evs = {name: (evs if name == stat else 0) for name in stat_names}
+    attack = pokedex.calculate_final_stats(attacker['base_stats'], attack_evs, {name: 31 for name in stat_names}, nature)[stat]
+
+    modifier = 1.5 if move_info['type'] in attacker['types'] else 1.0
+    first, second = type_chart.typing_ids(pokedex.pokemon_database[defender_name]['types'])
+    modifier *= type_chart.dual[type_chart.type_id(move_info['type']), first, second]
+    if spread:
+        modifier *= 0.75
+
+    return {'power': power, 'attack': attack, 'category': move_info['damage_type'], 'modifier': modifier}
+
+#Smallest EVs in one stat that survive every hit of a category, for each nature and HP investment, 64*64 grid per nature
+def bulk_needed(hits, hp, defense):
+    """hp is (hp evs,), defense is (natures, evs), returns (natures, hp evs) with 999 where nothing survives"""
+    survives = np.ones((defense.shape[0], len(hp), len(ev_steps)), dtype = bool)
+    for hit in hits:
+        damage = hit_damage(hit['power'], hit['attack'], defense, hit['modifier'])
+        survives &= damage[:, None, :] < hp[None, :, None]
+    needed = np.where(survives.any(axis = 2), ev_steps[survives.argmax(axis = 2)], 999)
+    return needed
+
+#Finds the spread that reaches a speed tier and survives the given hits with the fewest EVs, then puts the rest into invest
+def optimize_spread(pokemon_name, speed = None, max_speed = None, hits = (), invest = None, natures = None, ivs = None):
+    """speed is the lowest final speed to reach, max_speed the highest to stay under (Trick Room), hits come from make_hit
+    invest is the order leftover EVs go in, by default the better attacking stat then HP, Sp. Def and Defense
+    natures limits the natures tried, None tries all 25, returns {'nature', 'evs', 'stats'} or None if nothing is legal"""
+    base_data = pokedex.pokemon_database[pokemon_name]['base_stats']
+    base_stats = [base_data[stat] for stat in stat_names]
+    if invest is None:
+        invest = (max(['attack', 'sp_attack'], key = lambda stat: base_data[stat]), 'hp', 'sp_defense', 'defense')
+    ivs = [31]*6 if ivs is None else [ivs[stat] for stat in stat_names]
+    natures = np.arange(len(nature_names)) if natures is None else np.array([nature_id(nature.capitalize()) for nature in natures])
+
+    # Every stat for every nature and every amount of EVs, (natures, 64, 6)
+    table = batch_final_stats(base_stats, ev_steps[:, None], ivs, natures[:, None])
+    hp = table[0, :, 0]
+
+    # Speed is independent of the other stats, the fewest EVs that reach the tier
+    speeds = table[:, :, 5]
+    reach = np.ones(speeds.shape, dtype = bool)
+    if speed is not None:
+        reach &= speeds >= speed
+    if max_speed is not None:
+        reach &= speeds <= max_speed
+    speed_evs = np.where(reach.any(axis = 1), ev_steps[reach.argmax(axis = 1)], 999)
+    # Speed only grows with EVs, so the last spread that reaches the tier is the most leftover EVs can put in speed
+    speed_cap = ev_steps[len(ev_steps) - 1 - reach[:, ::-1].argmax(axis = 1)] if max_speed is not None else np.full(len(natures), 252)
+
+    # Physical hits only depend on HP and Defense and special hits on HP and Sp. Def, so each is its own grid
+    physical = [hit for hit in hits if hit['category'] == 'physical']
+    special = [hit for hit in hits if hit['category'] == 'special']
+    defense_evs = bulk_needed(physical, hp, table[:, :, 2])
+    sp_defense_evs = bulk_needed(special, hp, table[:, :, 4])
+    total = ev_steps[None, :] + defense_evs + sp_defense_evs + speed_evs[:, None]
+    legal = (defense_evs <= 252) & (sp_defense_evs <= 252) & (speed_evs[:, None] <= 252) & (total <= max_evs)
+    total = np.where(legal, total, 9999)
+    hp_index = total.argmin(axis = 1)
+
+    best = None
+    for row, nature in enumerate(natures.tolist()):
+        if not legal[row, hp_index[row]]:
+            continue
+        evs = {'hp': int(ev_steps[hp_index[row]]), 'attack': 0, 'defense': int(defense_evs[row, hp_index[row]]),
+               'sp_attack': 0, 'sp_defense': int(sp_defense_evs[row, hp_index[row]]), 'speed': int(speed_evs[row])}
+        leftover = max_evs - sum(evs.values())
+        caps = {stat: (int(speed_cap[row]) if stat == 'speed' else 252) for stat in stat_names}
+        for stat in invest:
+            added = max(min(leftover, caps[stat] - evs[stat]), 0)
+            evs[stat] += added
+            leftover -= added
+
+        stats = batch_final_stats(base_stats, [evs[stat] for stat in stat_names], ivs, nature)
+        # The nature that gives the most in the first invested stat wins, then the most stats overall
+        key = (int(stats[stat_names.index(invest[0])]), int(stats.sum()))
+        if best is None or key > best[0]:
+            best = (key, {'nature': nature_names[nature].lower(), 'evs': evs, 'stats': dict(zip(stat_names, stats.tolist()))})
+
+    return None if best is None else best[1]
@@ -0,0 +1,183 @@
+import json
+import os
+import pickle
+import numpy as np
+from collections.abc import Mapping
+
+#Member fields stored as integer codes, each with its own vocabulary
+store_codes = ['species', 'item', 'ability', 'tera_type', 'nature']
+store_stats = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+
+#Writes every team of every tournament as columns with one row per team member, sources is the pickle mtime of each tournament
+def build_team_store(tournament_teams, path, sources = None):
+    vocab = {column: [] for column in ['tournament', 'move'] + store_codes}
+    index = {column: {} for column in vocab}
+
+    def code(column, value):
+        if value is None:
+            return -1
+        if value not in index[column]:
+            index[column][value] = len(vocab[column])
+            vocab[column].append(value)
+        return index[column][value]
+
+    columns = {column: [] for column in ['tournament', 'team', 'slot', 'placement', 'cp', 'evs', 'ivs', 'moves'] + store_codes}
+    for tournament, teams in tournament_teams.items():
+        tournament_code = code('tournament', tournament)
+        for team_key, team in teams.items():
+            if not isinstance(team, dict):
+                continue
+            for slot in range(1, 7):
+                member = team.get(f"Member {slot}")
+                if member is None:
+                    continue
+                columns['tournament'].append(tournament_code)
+                columns['team'].append(int(team_key.rsplit(' ', 1)[1]))
+                columns['slot'].append(slot)
+                columns['placement'].append(team['placement'])
+                columns['cp'].append(team['cp'])
+                columns['species'].append(code('species', member['name']))
+                columns['item'].append(code('item', member['item']))
+                columns['ability'].append(code('ability', member['ability']))
+                columns['tera_type'].append(code('tera_type', member['tera_type']))
+                columns['nature'].append(code('nature', member['nature']))
+                columns['evs'].append([-1]*6 if member['evs'] is None else [member['evs'][stat] for stat in store_stats])
+                columns['ivs'].append([-1]*6 if member['ivs'] is None else [member['ivs'][stat] for stat in store_stats])
+                columns['moves'].append(([code('move', move) for move in member['moves']] + [-1]*4)[:4])
+
+    dtypes = {'tournament': np.int16, 'team': np.int32, 'slot': np.int8, 'placement': np.int16, 'cp': np.float64,
+              'evs': np.int16, 'ivs': np.int8, 'moves': np.int16}
+    os.makedirs(path, exist_ok = True)
+    for column, values in columns.items():
+        np.save(os.path.join(path, f"{column}.npy"), np.array(values, dtype = dtypes.get(column, np.int16)))
+    with open(os.path.join(path, 'vocab.json'), 'w') as file:
+        json.dump(vocab, file)
+    # Written last, a store left half built by a crash has no sources and gets rebuilt
+    with open(os.path.join(path, 'sources.json'), 'w') as file:
+        json.dump(sources or {}, file)
+
+#Pickle mtimes the store was built from, empty for a store that doesn't exist or predates them
+def store_sources(path):
+    sources_path = os.path.join(path, 'sources.json')
+    if not os.path.exists(sources_path):
+        return {}
+    with open(sources_path, 'r') as file:
+        return json.load(file)
+
+#Rebuilds the store from the tournament pickles when a tournament is missing from it or its pickle is newer than the store's copy
+def update_team_store(tournaments, path, pickle_dir):
+    sources = store_sources(path)
+    times = {tournament: os.path.getmtime(os.path.join(pickle_dir, f"{tournament}.pkl")) for tournament in tournaments}
+    stale = [tournament for tournament in tournaments if tournament not in sources or times[tournament] > sources[tournament]]
+    if not stale:
+        return False
+
+    # Tournaments already in the store stay in it as long as their pickles are still there
+    for tournament in sources:
+        pickle_path = os.path.join(pickle_dir, f"{tournament}.pkl")
+        if tournament not in times and os.path.exists(pickle_path):
+            times[tournament] = os.path.getmtime(pickle_path)
+
+    loaded_data = {}
+    for tournament in times:
+        with open(os.path.join(pickle_dir, f"{tournament}.pkl"), 'rb') as file:
+            loaded_data[tournament] = pickle.load(file)
+    print(f"Rebuilding the team store for {', '.join(stale)}")
+    build_team_store(loaded_data, path, times)
+    return True
+
+#Memory-mapped columns of the team store, nothing is read until a tournament's teams are used
+class Team_Store:
+    def __init__(self, path):
+        with open(os.path.join(path, 'vocab.json'), 'r') as file:
+            self.vocab = json.load(file)
+        self.codes = {column: {value: code for code, value in enumerate(values)} for column, values in self.vocab.items()}
+        self.columns = {}
+        for file_name in os.listdir(path):
+            if file_name.endswith('.npy'):
+                self.columns[file_name[:-4]] = np.load(os.path.join(path, file_name), mmap_mode = 'r')
+
+        # Rows are written one tournament after another, so each tournament is one slice
+        tournaments = np.asarray(self.columns['tournament'])
+        starts = np.flatnonzero(np.diff(tournaments, prepend = -1))
+        ends = np.append(starts[1:], len(tournaments))
+        self.slices = {self.vocab['tournament'][tournaments[start]]: slice(start, end) for start, end in zip(starts, ends)}
+
+    def tournament(self, name):
+        return Tournament_View(self, name, self.slices[name])
+
+    def code(self, column, value):
+        """Code of a value, -1 for a value the store doesn't have so it matches nothing"""
+        return self.codes[column].get(value, -1)
+
+    def select(self, tournaments = None, max_placement = None, species = None):
+        """Views of the tournaments, keeping only teams placing at or above max_placement or using a species"""
+        views = {}
+        for name in (tournaments or self.slices):
+            view = self.tournament(name)
+            if max_placement is not None or species is not None:
+                view = view.filter(max_placement, species)
+            views[name] = view
+        return views
+
+#Teams of one tournament, read like the dict of teams in the tournament pickles
+class Tournament_View(Mapping):
+    def __init__(self, store, name, rows, teams = None):
+        self.store = store
+        self.name = name
+        self.rows = rows
+        self.teams = teams
+
+    def team_rows(self):
+        """First row of each team, worked out the first time the view is used"""
+        if self.teams is None:
+            team = np.asarray(self.store.columns['team'][self.rows])
+            starts = np.flatnonzero(np.diff(team, prepend = -1))
+            self.teams = {int(team[start]): (self.rows.start + start, self.rows.start + end) for start, end in zip(starts, np.append(starts[1:], len(team)))}
+        return self.teams
+
+    def __len__(self):
+        return len(self.team_rows())
+
+    def __iter__(self):
+        return (f"{self.name} Team {team}" for team in self.team_rows())
+
+    def __getitem__(self, team_key):
+        start, end = self.team_rows()[int(team_key.rsplit(' ', 1)[1])]
+        columns = self.store.columns
+        vocab = self.store.vocab
+
+        def word(column, row):
+            value = int(columns[column][row])
+            return None if value < 0 else vocab[column][value]
+
+        team = {}
+        for row in range(start, end):
+            evs = columns['evs'][row]
+            ivs = columns['ivs'][row]
+            team[f"Member {int(columns['slot'][row])}"] = {
+                'name': word('species', row),
+                'item': word('item', row),
+                'ability': word('ability', row),
+                'tera_type': word('tera_type', row),
+                'evs': None if evs[0] < 0 else {stat: int(ev) for stat, ev in zip(store_stats, evs)},
+                'nature': word('nature', row),
+                'ivs': None if ivs[0] < 0 else {stat: int(iv) for stat, iv in zip(store_stats, ivs)},
+                'moves': [vocab['move'][move] for move in columns['moves'][row] if move >= 0]
+            }
+        team['placement'] = int(columns['placement'][start])
+        team['cp'] = float(columns['cp'][start])
+        return team
+
+    def filter(self, max_placement = None, species = None):
+        columns = self.store.columns
+        # -1 also marks members without a species, so a species the store doesn't have is checked before the rows
+        species_code = None if species is None else self.store.code('species', species)
+        teams = {}
+        for team, (start, end) in self.team_rows().items():
+            if max_placement is not None and columns['placement'][start] > max_placement:
+                continue
+            if species_code is not None and (species_code < 0 or species_code not in columns['species'][start:end]):
+                continue
+            teams[team] = (start, end)
+        return Tournament_View(self.store, self.name, self.rows, teams)
@@ -0,0 +1,547 @@
+import numpy as np
+from .pokedex import pokedex
+from .move_dex import move_dex
+from .move_table import move_table, role_mask, flag_bits
+from .type_chart import type_chart
+from . import data
+from .showdown import read_showdown_team
+from .speed_tiers import speed_tiers
+
+#Load teams and for scoring
+class Teams:
+    def __init__(self, team_info, team_flag = True):
+        data.load_data()
+        self.team = {}
+        self.member_names = []
+        self.slot_flags = None
+        if team_flag == True:
+            try:
+                self.cp = team_info['cp']
+                self.placement = team_info['placement']
+            except:
+                print(team_info)
+            for poke in range(6):
+                try:
+                    self.team[f'Member {poke + 1}'] = pokedex.load_instance(team_info[f'Member {poke + 1}'])
+                    self.member_names.append(team_info[f'Member {poke + 1}']['name'])
+                except:
+                    pass
+        else:
+            try:
+                self.cp = team_info['cp']
+                self.placement = team_info['placement']
+            except:
+                print(team_info)
+            for poke in range(6):
+                self.team[f'Member {poke + 1}'] = pokedex.create_instance(team_info[f'Member {poke + 1}'])
+                self.member_names.append(team_info[f'Member {poke + 1}']['name'])
+
+    def print_team_details(self):
+        for index, member in self.team.items():
+            pokedex.print_pokemon_details(member)
+
+    def role_composition(self):
+        roles = []
+        for index, member in self.team.items():
+            roles.extend(member['roles'])
+        roles = {'attacker': roles.count('attacker'),
+        'sp_attacker': roles.count('sp_attacker'),
+        'bulky': roles.count('bulky'),
+        'speedy': roles.count('speedy')
+        }
+        return roles
+
+    def speed_control(self):
+        ids, flags, members = self.move_flags()
+        return flag_count(flags, 'speed_control')
+
+    def pivoting_moves(self):
+        ids, flags, members = self.move_flags()
+        return flag_count(flags, 'pivot')
+
+    def move_scores(self):
+        """Mean over the members of their mean move rating, gathered from the move table's rating table"""
+        move_scores = []
+        for index in range(1,7):
+            member = self.team[f'Member {index}']
+            ids = move_table.resolve(member['moves'])
+            ratings = move_table.ratings()
+            member_types = [type_chart.type_ids.get(member_type, -2) for member_type in member['types']]
+            stab = np.isin(move_table['type'][ids], member_types).astype(np.intp)
+            move_scores.append(float(np.mean(ratings[ids, role_mask(member['roles']), stab])))
+        return float(np.mean(move_scores))
+
+    def weather(self):
+        weather_setters = {
+        'rain': ['Pelipper', 'Politoed'],
+        'sun': ['Torkoal'],
+        'hail': ['Ninetales-Alola', 'Abomasnow'],
+        'sand': ['Tyranitar', 'Hippowdon']
+        }
+        abusers = {
+        'rain': ['Archaludon', 'Volcarona'],
+        'sun': [],
+        'hail': [],
+        'sand': []
+        }
+
+        if 'Archaludon' not in self.member_names:
+            abusers['rain'].remove('Archaludon')
+        if 'Volcarona' not in self.member_names:
+            abusers['rain'].remove('Volcarona')
+
+        for index, member in self.team.items():
+            types = member['types']
+            for type in types:
+                if type == 'water':
+                    abusers['rain'].append(member['name'])
+                if type == 'fire':
+                    abusers['sun'].append(member['name'])
+                if type == 'ice':
+                    abusers['hail'].append(member['name'])
+                if type == 'steel':
+                    abusers['sand'].append(member['name'])
+                if type == 'rock':
+                    abusers['sand'].append(member['name'])
+                if type == 'ground':
+                    abusers['sand'].append(member['name'])
+
+        weather_types = []
+        for weather, setters in weather_setters.items():
+            weather_types.extend([weather for setter in setters if setter in self.member_names])
+
+        ids, flags, members = self.move_flags()
+        team_flags = int(np.bitwise_or.reduce(flags)) if len(flags) > 0 else 0
+        for weather in weather_setters:
+            if team_flags & flag_bits[f'sets_{weather}']:
+                weather_types.append(weather)
+
+        # Every different move of the team counts once
+        move_flags, move_types = self.distinct_moves()
+        water = int((move_types == type_chart.type_ids['water']).sum())
+        fire = int((move_types == type_chart.type_ids['fire']).sum())
+        recovery = flag_count(move_flags, 'recovery')
+
+        weather_abuse = 0
+        for weather in set(weather_types):
+            weather_abuse += len(abusers[weather])
+            #print(abusers[weather])
+
+        if 'rain' in weather_types:
+            weather_abuse += flag_count(move_flags, 'rain_boosted') + water
+            weather_abuse -= flag_count(move_flags, 'sun_boosted') + recovery + fire
+
+        if 'sun' in weather_types:
+            weather_abuse += flag_count(move_flags, 'sun_boosted') + recovery + fire
+            weather_abuse -= flag_count(move_flags, 'rain_boosted') + water
+
+        if 'hail' in weather_types:
+            weather_abuse += flag_count(move_flags, 'hail_boosted')
+            weather_abuse -= recovery
+
+        if 'sand' in weather_types:
+            weather_abuse -= flag_count(move_flags, 'sand_weakened') + recovery
+
+        return weather_abuse
+                
+    def terrain(self):
+        terrain_setters = {
+        'grass': ['Rillaboom'],
+        'psychic': ['Indeedee-male', 'Indeedee-female'],
+        }
+        terrain_types = []
+        for terrain, setters in terrain_setters.items():
+            terrain_types.extend([terrain for setter in setters if setter in self.member_names])
+
+        ids, flags, members = self.move_flags()
+        team_flags = int(np.bitwise_or.reduce(flags)) if len(flags) > 0 else 0
+        for terrain in ['grass', 'psychic', 'electric', 'mist']:
+            if team_flags & flag_bits[f'sets_{terrain}']:
+                terrain_types.append(terrain)
+
+        # Every different move of the team counts once
+        move_flags, move_types = self.distinct_moves()
+        items = [self.team[f'Member {index}']['item'] for index in range(1,7)]
+
+        terrain_seeds = {'grass': 'grassy-seed', 'psychic': 'psychic-seed', 'electric': 'electric-seed', 'mist': 'misty-seed'}
+
+        terrain_score = 0
+        for terrain, seed in terrain_seeds.items():
+            if terrain not in terrain_types:
+                continue
+            terrain_score += flag_count(move_flags, f'{terrain}_boosted')
+            # Misty Terrain doesn't boost fairy moves here, it only weakens dragon moves
+            if terrain != 'mist':
+                terrain_score += int((move_types == type_chart.type_ids[terrain]).sum())
+            if seed in items:
+                terrain_score += 1
+
+        if 'grass' in terrain_types:
+            terrain_score -= flag_count(move_flags, 'grass_weakened')
+        if 'mist' in terrain_types:
+            terrain_score -= int((move_types == type_chart.type_ids['dragon']).sum())
+
+        return terrain_score
+
+    def item_score(self):
+        items = [self.team[f'Member {index}']['item'] for index in range(1,7)]
+        abilities = [self.team[f'Member {index}']['ability'] for index in range(1,7)]
+        score = 0
+
+        for ability in abilities:
+            if 'surge' in ability:
+                for item in items:
+                    if 'seed' in item:
+                        if item != 'miracle-seed':
+                            score += 1
+                            if 'unburden' in abilities:
+                                score += 1
+        
+        ids, flags, members = self.move_flags()
+
+        type_items = {
+            'black-glasses': 'dark',
+            'charcoal': 'fire',
+            'chople-berry': 'fighting',
+            'colbur-berry': 'dark',
+            'dragon-fang': 'dragon',
+            'iron-plate': 'steel',
+            'metal-coat': 'steel',
+            'miracle-seed': 'grass',
+            'mystic-water': 'water',
+            'never-melt-ice': 'ice',
+            'shuca-berry': 'ground',
+            'sky-plate': 'flying',
+            'splash-plate': 'water',
+            'spell-tag': 'ghost',
+            'twisted-spoon': 'psychic'
+        }
+
+        role_items = {
+            'attacker': ['choice-band', 'clear-amulet', 'life-orb', 'expert-belt', 'mirror-herb', 'power-herb', 'razor-claw', 'room-service', 'scope-lens', 'white-herb'],
+            'sp_attacker': ['choice-specs', 'life-orb', 'expert-belt', 'mirror-herb', 'power-herb', 'razor-claw', 'room-service', 'scope-lens', 'throat-spray', 'white-herb'],
+            'speedy': ['choice-scarf', 'covert-cloak', 'covert-cloak', 'eject-pack', 'focus-sash', 'iron-ball', 'ability-shield'],
+            'bulky': ['assault-vest', 'covert-cloak', 'eject-pack', 'eviolite', 'iron-ball', 'jaboca-berry', 'leftovers', 'ability-shield', 'lum-berry', 'maranga-berry', 'mental-herb', 'power-bracer', 'rocky-helmet', 'sitrus-berry', 'weakness-policy', 'wiki-berry'],
+        }
+
+        for index in range(1,7):
+            member = self.team[f'Member {index}']
+            item = member['item']
+            type = member['types']
+            weakness = member['defensive_coverage']['Weak']
+            super_weakness = member['defensive_coverage']['Super Weak']
+            if item in type_items:
+                if 'berry' in item:
+                    if type_items[item] in weakness or type_items[item] in super_weakness:
+                        score += 1
+                elif type_items[item] in type:
+                    score += 1
+            if item in ['flame-orb', 'toxic-orb']:
+                if member['ability'] == 'guts':
+                    score += 1
+            if item == 'loaded-dice':
+                score += flag_count(flags[members == index], 'multi_hit')
+            for role in member['roles']:
+                if item in role_items[role]:
+                    score += 1
+
+        return score
+
+    def sleep(self):
+        score = 0
+
+        items = [self.team[f'Member {index}']['item'] for index in range(1,7)]
+        abilities = [self.team[f'Member {index}']['ability'] for index in range(1,7)]
+        teras = [self.team[f'Member {index}']['tera'] for index in range(1,7)]
+
+        prevent_abilities = ['vital-spirit', 'insomnia', 'purifying-salt', 'guts', 'good-as-gold', 'poison-heal']
+
+        tot_types = []
+        for member in range(1,7):
+            tot_types.extend(self.team[f'Member {member}']['types'])
+
+        score += tot_types.count('grass')
+        score += teras.count('grass')
+
+        score = 0
+        if 'safety-goggles' in items:
+            score += 1
+
+        for ability in abilities:
+            if ability in prevent_abilities:
+                score += 1
+
+        return score
+        
+    def team_usage(self, usage):
+        meta_score = 0
+        off_meta = 0
+        for member in self.member_names:
+            try:
+                meta_score += usage[member]['Average Usage']
+            except:
+                off_meta += 1
+        return [meta_score/6, off_meta/6]
+
+    def screens(self):
+        items = [self.team[f'Member {index}']['item'] for index in range(1,7)]
+        ids, flags, members = self.move_flags()
+        # Light Clay makes every screen count twice
+        if 'light-clay' in items:
+            return 2*flag_count(flags, 'screen')
+        return flag_count(flags, 'screen')
+
+    def random(self):
+        score = 0
+        moves = [self.team[f'Member {index}']['moves'] for index in range(1,7)]
+        tot_moves = []
+        for move_list in moves:
+            tot_moves.extend(move_list)
+
+        if 'dondozo' in self.member_names:
+            if 'tatsugiri-curly' in self.member_names:
+                score += 1
+
+        if 'annihilape' in self.member_names:
+            if 'beat-up' in tot_moves:
+                score += 1
+
+        if 'archaludon' in self.member_names:
+            if 'beat-up' in tot_moves:
+                score += 1
+
+        return score
+
+    def bst_avg(self):
+        bst_avg = 0
+        for index, member in self.team.items():
+            bst_avg += member['bst']
+        return bst_avg/600
+
+    def speed_spread(self):
+        speeds = [self.team[f'Member {index}']['stats']['speed'] for index in range(1,7)]
+        return [float(np.mean(speeds))/100 , float(np.std(speeds))/100]
+
+    def speed_tiers(self):
+        """Mean fraction of the usage weighted meta the members outspeed at neutral speed, under Tailwind and under Trick Room"""
+        speeds = [self.team[f'Member {index}']['stats']['speed'] for index in range(1,7)]
+        return speed_tiers.index().outspeed(speeds).mean(axis = 0).tolist()
+
+    def def_synergy(self):
+        defense = [self.team[f'Member {index}']['defensive_bits'] for index in range(1,7)]
+        def_score = 0
+        for member in defense:
+            imm = member['Immune'].bit_count()
+            sr = member['Super Resistant'].bit_count()
+            r = member['Resistant'].bit_count()
+            w = member['Weak'].bit_count()
+            sw = member['Super Weak'].bit_count()
+            rest = 18 - imm - sr - r - w - sw
+            def_score += (0.25*sr + 0.5*r + rest + 2.0*w + 4.0*sw)/18
+        return def_score/6
+    
+    def core_synergy(self):
+        """How well each member's resistances cover the others' weaknesses, on 18 bit type masks"""
+        defense = [self.team[f'Member {index}']['defensive_bits'] for index in range(1,7)]
+        overlap = 0
+        for member_check in defense:
+            weak = member_check['Weak']
+            sp_weak = member_check['Super Weak']
+            for member in defense:
+                resist = member['Resistant']
+                sp_resist = member['Super Resistant']
+                immune = member['Immune']
+                overlap += ((weak & resist).bit_count() + 2*(weak & sp_resist).bit_count() + 4*(weak & immune).bit_count()
+                            + 2*(sp_weak & resist).bit_count() + 4*(sp_weak & sp_resist).bit_count() + 8*(sp_weak & immune).bit_count())
+
+        # mean over the members of the overlap they get from the team, divided by the 5 other members
+        return float(overlap/30)
+
+    def off_synergy(self):
+        offense = [self.team[f'Member {index}']['stab_bits'] for index in range(1,7)]
+        off_score = 0
+        for member in offense:
+            imm = member['Immune'].bit_count()
+            r = member['Resistant'].bit_count()
+            w = member['Strong'].bit_count()
+            rest = 18 - r - w - imm
+            off_score += (0.5*r + rest + 2.0*w)/18
+        return off_score/6
+
+    def move_flags(self):
+        """Move ids, flag bitfields and member number of every move slot, gathered from the move table once per team"""
+        if self.slot_flags is None:
+            moves = []
+            members = []
+            for index in range(1,7):
+                member_moves = list(self.team[f'Member {index}']['moves'])
+                moves.extend(member_moves)
+                members.extend([index]*len(member_moves))
+            self.slot_moves = moves
+            self.slot_ids, self.slot_flags = move_table.move_flags(moves)
+            self.slot_members = np.array(members, dtype = np.intp)
+        return self.slot_ids, self.slot_flags, self.slot_members
+
+    def distinct_moves(self):
+        """Flags and type ids of each different move of the team"""
+        ids, flags, members = self.move_flags()
+        # Moves are told apart by name, every move the table doesn't have shares the id -1 but keeps its own flags
+        first = {}
+        for slot, move in enumerate(self.slot_moves):
+            first.setdefault(move, slot)
+        first = np.array(list(first.values()), dtype = np.intp)
+        types = np.where(ids[first] >= 0, move_table['type'][ids[first]], -1)
+        return flags[first], types
+
+    def move_names(self):
+        return [move for member in self.team.values() for move in member['moves']]
+
+    def typing_ids(self):
+        return [type_chart.typing_id(self.team[f'Member {index}']['types']) for index in range(1,7)]
+
+    def move_type_ids(self):
+        """Attacking type id of each of the team's 24 move slots, -1 for status moves and empty slots"""
+        type_ids = []
+        for index in range(1,7):
+            moves = list(self.team[f'Member {index}']['moves'])[:4]
+            ids = move_table.resolve(moves)
+            types = np.where(move_table['damage_class'][ids] == 0, -1, move_table['type'][ids])
+            type_ids.extend(types.tolist() + [-1]*(4 - len(moves)))
+        return type_ids
+
+    def move_coverage(self):
+        return move_coverage_kernels([self.move_type_ids()])[0]
+
+    def team_score(self, synergy = None, coverage = None):
+        """synergy (core, def, off) and coverage (super effective, resisted) are passed in when tree_data works them out for the whole tournament"""
+        if len(self.member_names) == 6:
+            if synergy is None:
+                synergy = [self.core_synergy(), self.def_synergy(), self.off_synergy()]
+            if coverage is None:
+                coverage = self.move_coverage()
+            roles = self.role_composition()
+            speed = self.speed_spread()
+            tiers = self.speed_tiers()
+            team_usage = self.team_usage(data.usage)
+            return {'core_synergy': float(synergy[0]),
+                    'def_synergy': float(synergy[1]),
+                    'off_synergy': float(synergy[2]),
+                    'move_coverage': int(coverage[0]),
+                    'move_resisted': int(coverage[1]),
+                    'avg_speed': speed[0],
+                    'std_speed': speed[1],
+                    'outspeed': tiers[0],
+                    'tailwind_outspeed': tiers[1],
+                    'trick_room_outspeed': tiers[2],
+                    'bst_avg': self.bst_avg(),
+                    'move_scores': (self.move_scores()+self.pivoting_moves()+self.screens()+self.speed_control())/4,
+                    'item_scores': self.item_score(),
+                    'sleep_prevention': self.sleep(),
+                    'meta_usage': team_usage[0],
+                    'off_meta': team_usage[1],
+                    'speed_control': self.speed_control(),
+                    #'pivoting_moves': self.pivoting_moves(),
+                    'weather': self.weather(),
+                    'terrain': self.terrain(),
+                    #'screens': self.screens(),
+                    'random': self.random()
+            }
+        else:
+            return None
+
+    def display_team_scores(self):
+        print(self.member_names)
+        print("Core:", self.core_synergy())
+        print("Def:", self.def_synergy())
+        print("Off:", self.off_synergy())
+        print("Move Coverage:", self.move_coverage())
+        print("Spd:", self.speed_spread())
+        print("Speed Tiers:", self.speed_tiers())
+        print("BST Avg:", self.bst_avg())
+        print("Move:", self.move_scores())
+        print("Roles:", self.role_composition())
+        print("Speed Control:", self.speed_control())
+        print("Pivot Control:", self.pivoting_moves())
+        print("Weather:", self.weather())
+        print("Terrain:", self.terrain())
+        print("Screen:", self.screens())
+        print("Random:", self.random())
+
+#How many of the moves have a flag
+def flag_count(flags, flag):
+    return int(((flags & flag_bits[flag]) > 0).sum())
+
+#Core, defensive and offensive synergy of N teams at once from an (N, 6) array of typing ids, returns (N, 3)
+def synergy_kernels(typings):
+    typings = np.asarray(typings, dtype = np.intp).reshape(-1, 6)
+    immune, resist, sp_resist, weak, sp_weak = type_chart.typing_def_masks[:, typings]
+
+    # Same weights as core_synergy, a weakness pairs with every resistance on the team to its attacking type
+    weakness = (weak + 2*sp_weak).sum(axis = 1)
+    cover = (resist + 2*sp_resist + 4*immune).sum(axis = 1)
+    core = (weakness*cover).sum(axis = 1)/30
+
+    # def_synergy is the mean effectiveness of every attacking type on every member
+    defense = type_chart.typing_effectiveness[:, typings].mean(axis = (0, 2))
+
+    stab_immune, stab_resist, strong = type_chart.typing_stab_masks[:, typings]
+    offense = (1 - stab_immune - 0.5*stab_resist + strong).mean(axis = (1, 2))
+
+    return np.stack([core, defense, offense], axis = 1)
+
+#Super effective and resisted coverage of N teams' moves from an (N, 24) array of move type ids, -1 for no damaging move, returns (N, 2)
+def move_coverage_kernels(move_types):
+    move_types = np.asarray(move_types, dtype = np.intp).reshape(-1, 24)
+
+    # How many damaging moves of each attacking type every team has
+    type_counts = (move_types[:, :, None] == np.arange(18)).sum(axis = 1)
+
+    # For each defending type, how many of the team's moves are super effective on it and how many it resists
+    super_effective = type_counts @ (type_chart.effectiveness == 2.0).astype(int)
+    resisted = type_counts @ (type_chart.effectiveness < 1.0).astype(int)
+
+    # Types the team hits super effectively, and types that resist more of its moves than they're weak to
+    return np.stack([(super_effective > 0).sum(axis = 1), (resisted > super_effective).sum(axis = 1)], axis = 1)
+
+#Construct X, y for the models
+def tree_data(tournament, flag):
+    loaded = []
+    for team in tournament:
+        try:
+            team = Teams(tournament[team], team_flag = flag)
+            if len(team.member_names) == 6:
+                loaded.append(team)
+        except:
+            pass
+
+    # Moves the database doesn't know are all fetched at once up front instead of one at a time while scoring
+    move_dex.resolve_moves([move for team in loaded for move in team.move_names()])
+    teams = []
+    for team in loaded:
+        try:
+            teams.append((team, team.typing_ids(), team.move_type_ids()))
+        except:
+            pass
+
+    # The synergy and coverage columns of the whole tournament come from one call of the batched kernels
+    synergy = synergy_kernels([typings for team, typings, move_types in teams])
+    coverage = move_coverage_kernels([move_types for team, typings, move_types in teams])
+    score_vectors = []
+    cp_result = []
+    for i, (team, typings, move_types) in enumerate(teams):
+        try:
+            team_score = team.team_score(synergy = synergy[i], coverage = coverage[i])
+            score_vectors.append(list(team_score.values()))
+            cp_result.append(team.cp)
+        except:
+            pass
+
+    if len(score_vectors) == 1:
+        return [score_vectors[0], cp_result]
+    return [np.array(score_vectors) if score_vectors else [], cp_result]
+
+#Features of one team from the text of its Showdown export
+def score_paste(text):
+    team = Teams(read_showdown_team(text))
+    move_dex.resolve_moves(team.move_names())
+    return team.team_score()
@@ -0,0 +1,216 @@
+import numpy as np
+from types import MappingProxyType
+
+#Stores information about the type chart
+class Type_Chart:
+    def __init__(self):
+        self.types = [
+            'normal', 'fire', 'water', 'electric', 'grass', 'ice',
+            'fighting', 'poison', 'ground', 'flying', 'psychic', 'bug',
+            'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy'
+        ]
+        
+        self.type_ids = {attack_type: i for i, attack_type in enumerate(self.types)}
+        self.type_bits = {attack_type: 1 << i for i, attack_type in enumerate(self.types)}
+
+        # Initialize effectiveness matrix 
+        self.effectiveness = np.ones((18, 18))
+        
+        self.setup_type_chart()
+        self.setup_typings()
+        self.setup_coverage_tables()
+    
+    def setup_type_chart(self):
+        super_effective = {
+            'normal': [],
+            'fire': ['grass', 'ice', 'bug', 'steel'],
+            'water': ['fire', 'ground', 'rock'],
+            'electric': ['water', 'flying'],
+            'grass': ['water', 'ground', 'rock'],
+            'ice': ['grass', 'ground', 'flying', 'dragon'],
+            'fighting': ['normal', 'ice', 'rock', 'dark', 'steel'],
+            'poison': ['grass', 'fairy'],
+            'ground': ['fire', 'electric', 'poison', 'rock', 'steel'],
+            'flying': ['grass', 'fighting', 'bug'],
+            'psychic': ['fighting', 'poison'],
+            'bug': ['grass', 'psychic', 'dark'],
+            'rock': ['fire', 'ice', 'flying', 'bug'],
+            'ghost': ['psychic', 'ghost'],
+            'dragon': ['dragon'],
+            'dark': ['psychic', 'ghost'],
+            'steel': ['ice', 'rock', 'fairy'],
+            'fairy': ['fighting', 'dragon', 'dark']
+        }
+
+        not_very_effective = {
+            'normal': ['rock', 'steel'],
+            'fire': ['fire', 'water', 'rock', 'dragon'],
+            'water': ['water', 'grass', 'dragon'],
+            'electric': ['electric', 'grass', 'dragon'],
+            'grass': ['fire', 'grass', 'poison', 'flying', 'bug', 'dragon', 'steel'],
+            'ice': ['fire', 'water', 'ice', 'steel'],
+            'fighting': ['poison', 'flying', 'psychic', 'bug', 'fairy'],
+            'poison': ['poison', 'ground', 'rock', 'ghost'],
+            'ground': ['grass', 'bug'],
+            'flying': ['electric', 'rock', 'steel'],
+            'psychic': ['psychic', 'steel'],
+            'bug': ['fire', 'fighting', 'poison', 'flying', 'ghost', 'steel', 'fairy'],
+            'rock': ['fighting', 'ground', 'steel'],
+            'ghost': ['dark'],
+            'dragon': ['steel'],
+            'dark': ['fighting', 'dark', 'fairy'],
+            'steel': ['fire', 'water', 'electric', 'steel'],
+            'fairy': ['fire', 'poison', 'steel']
+        }
+        
+        immune = {
+            'normal': ['ghost'],
+            'fire': [],
+            'water': [],
+            'electric': ['ground'],
+            'grass': [],
+            'ice': [],
+            'fighting': ['ghost'],
+            'poison': ['steel'],
+            'ground': ['flying'],
+            'flying': [],
+            'psychic': ['dark'],
+            'bug': [],
+            'rock': [],
+            'ghost': ['normal'],
+            'dragon': ['fairy'],
+            'dark': [],
+            'steel': [],
+            'fairy': []
+        }
+        
+        # Apply the effectiveness rules to the matrix
+        for i, attack_type in enumerate(self.types):
+            # Apply super effective
+            for defense_type in super_effective[attack_type]:
+                j = self.type_ids[defense_type]
+                self.effectiveness[i, j] = 2.0
+            
+            # Apply not very effective
+            for defense_type in not_very_effective[attack_type]:
+                j = self.type_ids[defense_type]
+                self.effectiveness[i, j] = 0.5
+            
+            # Apply immune
+            for defense_type in immune[attack_type]:
+                j = self.type_ids[defense_type]
+                self.effectiveness[i, j] = 0.0
+   
+    def setup_typings(self):
+        """Precomputes every single and dual typing, a single typing is stored as (type, type)"""
+        # dual[attack, defense1, defense2], the diagonal is the single typing
+        self.dual = self.effectiveness[:, :, None] * self.effectiveness[:, None, :]
+        diagonal = np.arange(18)
+        self.dual[:, diagonal, diagonal] = self.effectiveness
+
+        # Defensive categories of each typing over the attacking types, [category, defense1, defense2, attack]
+        defense = np.moveaxis(self.dual, 0, -1)
+        self.def_categories = ['Immune', 'Resistant', 'Super Resistant', 'Weak', 'Super Weak']
+        self.def_masks = np.stack([defense == value for value in [0, 0.5, 0.25, 2.0, 4.0]])
+
+        # STAB categories of each pair of attacking types over the defending types, [category, stab1, stab2, defense]
+        stab1 = self.effectiveness[:, None, :]
+        stab2 = self.effectiveness[None, :, :]
+        self.stab_categories = ['Immune', 'Resistant', 'Strong']
+        self.stab_masks = np.stack([
+            (stab1 == 0) & (stab2 == 0),
+            (stab1 <= 0.5) & (stab2 <= 0.5) & ((stab1 == 0.5) | (stab2 == 0.5)),
+            (stab1 == 2.0) | (stab2 == 2.0)
+        ])
+
+        # The same tables over a single typing id, defense1*18 + defense2
+        self.typing_effectiveness = self.dual.reshape(18, 324)
+        self.typing_def_masks = self.def_masks.reshape(5, 324, 18)
+        self.typing_stab_masks = self.stab_masks.reshape(3, 324, 18)
+
+    def setup_coverage_tables(self):
+        """Coverage lists and bits of every typing id, built once and shared read-only by every instance"""
+        bits = 1 << np.arange(18)
+        def_bits = (self.typing_def_masks * bits).sum(axis = -1).tolist()
+        stab_bits = (self.typing_stab_masks * bits).sum(axis = -1).tolist()
+
+        self.def_coverage_table = []
+        self.stab_coverage_table = []
+        self.def_bits_table = []
+        self.stab_bits_table = []
+        for typing in range(324):
+            self.def_coverage_table.append(MappingProxyType(self.coverage_lists(self.def_categories, self.typing_def_masks[:, typing], tuple)))
+            self.stab_coverage_table.append(MappingProxyType(self.coverage_lists(self.stab_categories, self.typing_stab_masks[:, typing], tuple)))
+            self.def_bits_table.append(MappingProxyType({category: def_bits[i][typing] for i, category in enumerate(self.def_categories)}))
+            self.stab_bits_table.append(MappingProxyType({category: stab_bits[i][typing] for i, category in enumerate(self.stab_categories)}))
+
+    def type_id(self, type_name):
+        try:
+            return self.type_ids[type_name]
+        except KeyError:
+            raise ValueError(f"{type_name} is not a type")
+
+    def typing_ids(self, typing):
+        """(id, id) of a typing like ['fire'] or ['fire', 'flying'], a single type is repeated"""
+        first = self.type_id(typing[0])
+        if len(typing) > 1 and typing[1] is not None:
+            return first, self.type_id(typing[1])
+        return first, first
+
+    def typing_id(self, typing):
+        """Single id of a typing, indexes the typing_ tables"""
+        first, second = self.typing_ids(typing)
+        return first*18 + second
+
+    def typings_ids(self, typings):
+        """(N, 2) array of ids for many typings"""
+        return np.array([self.typing_ids(typing) for typing in typings], dtype = np.intp).reshape(-1, 2)
+
+    def effectiveness_internal(self, attack_type, defense_type):
+        return self.effectiveness[self.type_id(attack_type), self.type_id(defense_type)]
+    
+    def effectiveness_calc_def(self, attack_type, defense_type1, defense_type2=None):
+        if defense_type2 is None:
+            return self.effectiveness_internal(attack_type, defense_type1)
+        return self.dual[self.type_id(attack_type), self.type_id(defense_type1), self.type_id(defense_type2)]
+    
+    def effectiveness_calc_atk(self, attack_type1, attack_type2, defense_type):
+        if attack_type2 is None:
+            return self.effectiveness_internal(attack_type1, defense_type)
+        
+        eff1 = self.effectiveness_internal(attack_type1, defense_type)
+        eff2 = self.effectiveness_internal(attack_type2, defense_type)
+        return [eff1, eff2]
+
+    def def_coverage_masks(self, ids):
+        """Defensive category masks for (N, 2) typing ids, shape (N, 5, 18)"""
+        ids = np.asarray(ids)
+        return np.moveaxis(self.def_masks[:, ids[..., 0], ids[..., 1]], 0, -2)
+
+    def stab_coverage_masks(self, ids):
+        """STAB category masks for (N, 2) typing ids, shape (N, 3, 18)"""
+        ids = np.asarray(ids)
+        return np.moveaxis(self.stab_masks[:, ids[..., 0], ids[..., 1]], 0, -2)
+
+    def coverage_lists(self, categories, masks, container = list):
+        return {category: container(self.types[j] for j in np.flatnonzero(mask)) for category, mask in zip(categories, masks)}
+
+    def get_stab_coverage(self, stab_type):
+        """A fresh dict of lists, safe to store in the pokedex"""
+        return {category: list(types) for category, types in self.stab_coverage_table[self.typing_id(stab_type)].items()}
+    
+    def def_coverage(self, defense_type):
+        """A fresh dict of lists, safe to store in the pokedex"""
+        return {category: list(types) for category, types in self.def_coverage_table[self.typing_id(defense_type)].items()}
+
+    def shared_def_coverage(self, defense_type):
+        """The shared read-only coverage of a typing, categories hold tuples"""
+        return self.def_coverage_table[self.typing_id(defense_type)]
+
+    def shared_def_bits(self, defense_type):
+        return self.def_bits_table[self.typing_id(defense_type)]
+
+    def shared_stab_bits(self, stab_type):
+        return self.stab_bits_table[self.typing_id(stab_type)]
+
+type_chart = Type_Chart()